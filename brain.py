@@ -1,89 +1,148 @@
-import math
+import numpy as np
+from gene import unpack
+
+
+def _wrap_ids(source_type, source_id, sink_type, sink_id, num_sensors, num_actions, num_internal):
+    """Map raw gene IDs onto valid sensor/neuron/action indices using modulo"""
+    source_id = np.where(source_type == 1, source_id % num_sensors, source_id % num_internal)
+    sink_id = np.where(sink_type == 1, sink_id % num_actions, sink_id % num_internal)
+    return source_id, sink_id
+
+
+def build_weights(genomes, num_sensors, num_actions, num_internal):
+    """
+    Build the weight matrix of every genome in one vectorized pass.
+
+    genomes = list of Genome objects
+    returns = (len(genomes), num_internal + num_actions, num_sensors + num_internal)
+              float32 array, entry i equal to Brain(genomes[i], ...).W
+
+    All genes are decoded together and scattered with one bincount, so a
+    whole generation costs a few NumPy calls instead of one Brain per creature.
+    """
+    rows_per = num_internal + num_actions
+    cols_per = num_sensors + num_internal
+    size = len(genomes)
+    if size == 0:
+        return np.zeros((0, rows_per, cols_per), dtype=np.float32)
+
+    genes = np.concatenate([genome.genes for genome in genomes])
+    owner = np.repeat(np.arange(size), [len(genome.genes) for genome in genomes])
+
+    source_type, source_id, sink_type, sink_id, weight = unpack(genes)
+    source_id, sink_id = _wrap_ids(source_type, source_id, sink_type, sink_id,
+                                   num_sensors, num_actions, num_internal)
+
+    # Same layout as Brain.W; parallel edges land on the same cell and sum
+    rows = np.where(sink_type == 1, num_internal + sink_id, sink_id)
+    cols = np.where(source_type == 1, source_id, num_sensors + source_id)
+    flat = (owner * rows_per + rows) * cols_per + cols
+    W = np.bincount(flat, weights=weight, minlength=size * rows_per * cols_per)
+    return W.astype(np.float32).reshape(size, rows_per, cols_per)
+
 
 class Brain:
     def __init__(self, genome, num_sensors, num_actions, num_internal):
         """
-        Takes a genome (list of genes) and builds a working brain.
-        
+        Takes a genome (packed genes) and builds a working brain.
+
         genome = Genome object from genome.py
         num_sensors = how many sensors exist (e.g. 8)
         num_actions = how many actions exist (e.g. 6)
         num_internal = how many internal neurons (e.g. 4)
         """
-        
+
         self.num_sensors = num_sensors
         self.num_actions = num_actions
         self.num_internal = num_internal
-        
+
+        # Connections as parallel arrays (SoA)
+        source_type, source_id, sink_type, sink_id, weight = genome.unpack()
+
         # Map gene IDs to valid indices using modulo
-        self.connections = []
-        
-        for gene in genome.genes:
-            if gene.source_type == 1:  # sensor
-                source_id = gene.source_id % num_sensors
-            else:  # neuron
-                source_id = gene.source_id % num_internal
-            
-            if gene.sink_type == 1:  # action
-                sink_id = gene.sink_id % num_actions
-            else:  # neuron
-                sink_id = gene.sink_id % num_internal
-            
-            self.connections.append((
-                gene.source_type,
-                source_id,
-                gene.sink_type,
-                sink_id,
-                gene.weight
-            ))
-        
-        # Neuron memory - stores previous outputs
-        self.neuron_outputs = {}
-        for i in range(num_internal):
-            self.neuron_outputs[i] = 0.0
-    
+        source_id, sink_id = _wrap_ids(source_type, source_id, sink_type, sink_id,
+                                       num_sensors, num_actions, num_internal)
+
+        # Merge parallel edges (same source and sink after the modulo) into one
+        # connection with the summed weight
+        key = ((source_type.astype(np.int32) * 128 + source_id) * 2 + sink_type) * 128 + sink_id
+        key, first, inverse = np.unique(key, return_index=True, return_inverse=True)
+        self.conn_weight = np.bincount(inverse, weights=weight, minlength=len(key)).astype(np.float32)
+        self.conn_source_type = (key >> 15).astype(np.int8)
+        self.conn_source_id = ((key >> 8) & 0x7F).astype(np.int8)
+        self.conn_sink_type = ((key >> 7) & 0x1).astype(np.int8)
+        self.conn_sink_id = (key & 0x7F).astype(np.int8)
+
+        # One weight matrix for the whole brain — rows are sinks, columns are sources.
+        # Rows: internal neurons then actions. Columns: sensors then internal neurons.
+        # Each step is then a single matrix-vector product.
+        self.W = np.zeros((num_internal + num_actions, num_sensors + num_internal), dtype=np.float32)
+
+        # Every connection has its own cell now, so a plain scatter fills W
+        rows = np.where(self.conn_sink_type == 1, num_internal + self.conn_sink_id, self.conn_sink_id)
+        cols = np.where(self.conn_source_type == 1, self.conn_source_id, num_sensors + self.conn_source_id)
+        self.W[rows, cols] = self.conn_weight
+
+        # Which cells of W hold a connection (a gene's weight can be exactly 0)
+        self.connected = np.zeros(self.W.shape, dtype=bool)
+        self.connected[rows, cols] = True
+
+        # Position in the genome of the first gene behind each connection,
+        # -1 where unwired - lets the display list connections in gene order
+        self.first_gene = np.full(self.W.shape, -1, dtype=np.int32)
+        self.first_gene[rows, cols] = first
+
+        # The genome can't change during a lifetime - freeze W so nothing
+        # edits it by accident. Views taken below inherit read-only.
+        self.W.setflags(write=False)
+
+        # Named views onto the four blocks of W
+        # W_sn = sensor -> neuron, W_sa = sensor -> action
+        # W_nn = neuron -> neuron, W_na = neuron -> action
+        self.W_sn = self.W[:num_internal, :num_sensors]
+        self.W_sa = self.W[num_internal:, :num_sensors]
+        self.W_nn = self.W[:num_internal, num_sensors:]
+        self.W_na = self.W[num_internal:, num_sensors:]
+
+        # Work buffers reused by every feed_forward call, so a step allocates nothing.
+        # _inputs holds [sensors | previous neuron outputs]; neuron_state is a
+        # view onto its tail, so writing the new outputs there is the memory.
+        self._inputs = np.zeros(num_sensors + num_internal, dtype=np.float32)
+        self._acc = np.zeros(num_internal + num_actions, dtype=np.float32)
+        self.neuron_state = self._inputs[num_sensors:]
+
+    @property
+    def connections(self):
+        """Connections as (source_type, source_id, sink_type, sink_id, weight) tuples — for display"""
+        return list(zip(self.conn_source_type.tolist(),
+                        self.conn_source_id.tolist(),
+                        self.conn_sink_type.tolist(),
+                        self.conn_sink_id.tolist(),
+                        self.conn_weight.tolist()))
 
     def feed_forward(self, sensor_values):
         """
         Run one step of thinking.
-        
-        sensor_values = dict like {0: 0.8, 1: 0.3, 2: 0.5}
-                        where key = sensor ID, value = what that sensor reads
-        
-        returns = dict like {0: -0.84, 1: 0.2}
-                  where key = action ID, value = how strongly to do that action
+
+        sensor_values = array of length num_sensors
+                        where index = sensor ID, value = what that sensor reads
+
+        returns = array of length num_actions
+                  where index = action ID, value = how strongly to do that action
+                  (a view into a reused buffer — valid until the next call)
         """
-        
-        # Create accumulators
-        neuron_accumulators = {}
-        for i in range(self.num_internal):
-            neuron_accumulators[i] = 0.0
-        
-        action_accumulators = {}
-        for i in range(self.num_actions):
-            action_accumulators[i] = 0.0
-        
-        # Process each connection
-        for (source_type, source_id, sink_type, sink_id, weight) in self.connections:
-            if source_type == 1:  # sensor
-                source_value = sensor_values.get(source_id, 0.0)
-            else:  # neuron - use previous step's output
-                source_value = self.neuron_outputs.get(source_id, 0.0)
-            
-            signal = source_value * weight
-            
-            if sink_type == 1:  # action
-                action_accumulators[sink_id] += signal
-            else:  # neuron
-                neuron_accumulators[sink_id] += signal
-        
-        # Squash with tanh [-1, 1] and save for next step
-        for i in range(self.num_internal):
-            self.neuron_outputs[i] = math.tanh(neuron_accumulators[i])
-        
-        # Squash actions and return
-        action_outputs = {}
-        for i in range(self.num_actions):
-            action_outputs[i] = math.tanh(action_accumulators[i])
-        
-        return action_outputs
\ No newline at end of file
+
+        # Neurons read this step's sensors plus the previous step's neuron outputs
+        inputs = self._inputs
+        acc = self._acc
+        inputs[:self.num_sensors] = sensor_values
+        np.matmul(self.W, inputs, out=acc)
+
+        # Squash with tanh [-1, 1] in place.
+        # np.tanh is already a SIMD loop; cheaper than any rational
+        # approximation built from several separate NumPy ops.
+        np.tanh(acc, out=acc)
+
+        # Save neuron outputs for next step, return the actions
+        self.neuron_state[:] = acc[:self.num_internal]
+        return acc[self.num_internal:]
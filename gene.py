@@ -1,5 +1,6 @@
 
 import random
+import numpy as np
 
 class Gene:
     def __init__(self, source_type, source_id, sink_type, sink_id, weight):
@@ -15,11 +16,7 @@ class Gene:
     @classmethod
     def random(cls):
         """Create a random gene"""
-        return cls(random.randint(0, 1),
-            random.randint(0, 127),
-            random.randint(0, 1),
-            random.randint(0, 127),
-            random.uniform(-4.0, 4.0))
+        return cls.from_int(int(random_packed(1)[0]))
     
     def to_int(self):
         """Pack into 32-bit integer"""
@@ -56,13 +53,42 @@ class Gene:
 
     def mutate(self):
         """Flip a single random bit"""
-        packed = self.to_int()
         bit = random.randint(0, 31)
-        packed ^= (1 << bit)
-        mutated = Gene.from_int(packed)
-        self.source_type = mutated.source_type
-        self.source_id = mutated.source_id
-        self.sink_type = mutated.sink_type
-        self.sink_id = mutated.sink_id
-        self.weight = mutated.weight
+        if bit >= 16:
+            # Type/id bits - flip the field directly, no pack/unpack round trip
+            if bit == 31:
+                self.source_type ^= 1
+            elif bit >= 24:
+                self.source_id ^= 1 << (bit - 24)
+            elif bit == 23:
+                self.sink_type ^= 1
+            else:
+                self.sink_id ^= 1 << (bit - 16)
+        else:
+            # Weight bits - flip in the 16-bit quantized weight, rebuild only the float
+            w_int = max(-32768, min(32767, int(self.weight / 4.0 * 32767)))
+            w_uint = (w_int & 0xFFFF) ^ (1 << bit)
+            w_int = w_uint if w_uint < 32768 else w_uint - 65536
+            self.weight = (w_int / 32767.0) * 4.0
 
+
+def random_packed(count):
+    """Random packed genes - every 32-bit pattern is a valid gene"""
+    return np.random.randint(0, 2**32, size=count, dtype=np.uint32)
+
+
+def unpack(packed):
+    """Decode a uint32 array of packed genes into field arrays.
+
+    Same bit layout as Gene.from_int, applied to every gene at once.
+    Returns (source_type, source_id, sink_type, sink_id, weight).
+    """
+    packed = np.asarray(packed, dtype=np.uint32)
+    source_type = ((packed >> 31) & 0x1).astype(np.int8)
+    source_id = ((packed >> 24) & 0x7F).astype(np.int8)
+    sink_type = ((packed >> 23) & 0x1).astype(np.int8)
+    sink_id = ((packed >> 16) & 0x7F).astype(np.int8)
+    w_int = (packed & 0xFFFF).astype(np.uint16).view(np.int16)
+    weight = w_int.astype(np.float32) * np.float32(4.0 / 32767.0)
+
+    return source_type, source_id, sink_type, sink_id, weight
@@ -1,49 +1,59 @@
-from gene import Gene
+from gene import random_packed, unpack
+import numpy as np
 import random
 
 class Genome:
-    def __init__(self, genes: list[Gene]):
-        self.genes = genes
-    
+    def __init__(self, genes):
+        # genes: uint32 array, one packed gene per entry (layout in Gene.to_int)
+        self.genes = np.asarray(genes, dtype=np.uint32)
+
     @classmethod
     def random(cls, num_genes):
-        genes = []
-        for i in range(num_genes):
-            genes.append(Gene.random())
-        return cls(genes)
-    
+        return cls(random_packed(num_genes))
+
+    def copy(self):
+        """Return a genome with its own copy of the genes"""
+        return Genome(self.genes.copy())
+
+    def unpack(self):
+        """Decode every gene -> (source_type, source_id, sink_type, sink_id, weight) arrays"""
+        return unpack(self.genes)
+
     def mutate(self, mutation_rate):
         """Point mutations, insertions, deletions"""
-        for gene in self.genes:
-            # Point mutation - flip a random bit
-            if random.random() < mutation_rate:
-                gene.mutate()
-        
+        # Point mutation - flip one random bit in each gene that mutates,
+        # done for every gene at once with a single XOR
+        mask = np.random.random(self.genes.shape) < mutation_rate
+        bit_positions = np.random.randint(0, 32, size=self.genes.shape).astype(np.uint32)
+        xor_mask = np.where(mask, np.uint32(1) << bit_positions, np.uint32(0))
+        self.genes ^= xor_mask
+
         # Deletion - remove a random gene
         if random.random() < mutation_rate * 0.2 and len(self.genes) > 1:
-            self.genes.pop(random.randint(0, len(self.genes) - 1))
-        
+            self.genes = np.delete(self.genes, random.randint(0, len(self.genes) - 1))
+
         # Insertion - add a new random gene
         if random.random() < mutation_rate * 0.2 and len(self.genes) < 50:
-            self.genes.append(Gene.random())
+            self.genes = np.append(self.genes, random_packed(1))
 
     @staticmethod
     def crossover(parent_a, parent_b):
         """Sexual reproduction - combine two genomes"""
         parent_a_genes = random.randint(0, len(parent_a.genes))
         parent_b_genes = random.randint(0, len(parent_b.genes))
-        child_genes = [g.copy() for g in parent_a.genes[:parent_a_genes]] + [g.copy() for g in parent_b.genes[parent_b_genes:]]
+        # concatenate always copies, so the child never shares memory with a parent
+        child_genes = np.concatenate((parent_a.genes[:parent_a_genes], parent_b.genes[parent_b_genes:]))
 
         if len(child_genes) > 50:
             child_genes = child_genes[:50]
-    
+
         # Need at least 1 gene
         if len(child_genes) == 0:
-            child_genes = [Gene.random()]
-            
+            child_genes = random_packed(1)
+
         child = Genome(child_genes)
         return child
 
     def __str__(self):
         """Pretty print the genome"""
-        return ", ".join(gene.to_hex() for gene in self.genes)
\ No newline at end of file
+        return ", ".join(f"{gene:08x}" for gene in self.genes)
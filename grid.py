@@ -4,8 +4,32 @@ class Grid:
     def __init__(self, width, height):
         self.width = width  # grid width in cells
         self.height = height  # grid height in cells
-        self.data = np.zeros((width, height), dtype=np.int32)  # 2D array: 0=empty, >0=creature index+1
-        self.barriers = set()  # permanent obstacles, set of (x, y) tuples
+        # 2D array: 0=empty, >0=creature index+1. At most one creature per cell,
+        # so int16 holds every index on grids up to 32767 cells - half the bytes
+        # of int32 for the per-step occupancy passes and sensor gathers
+        cell_dtype = np.int16 if width * height <= np.iinfo(np.int16).max else np.int32
+        self.data = np.zeros((width, height), dtype=cell_dtype)
+
+        # Sensor scale factors, precomputed so sensors multiply instead of divide
+        self.inv_w1 = 1.0 / (width - 1)  # x -> [0, 1]
+        self.inv_h1 = 1.0 / (height - 1)  # y -> [0, 1]
+        self.max_possible_inv = 1.0 / (min(width, height) // 2)  # edge distance -> [0, 1]
+        self.barrier_mask = np.zeros((width, height), dtype=bool)  # permanent obstacles, True = barrier
+        self._empty_cells = None  # flat indices (x * height + y) of empty cells, rebuilt lazily
+
+        # Occupancy snapshots, refreshed once per step by update_neighbor_counts()
+        self.neighbor_radius = 1
+        # True once creatures have been placed or moved since the last update -
+        # the snapshots below then no longer match data
+        self.snapshots_stale = True
+        self._neighbor_count = None  # box counts behind neighbor_count, summed on first read
+        self.neighbor4 = np.zeros((width, height), dtype=np.int8)  # occupied cells directly N/S/E/W
+        # 1 where a creature stands, with a one-cell empty border
+        self._padded_occupied = np.zeros((width + 2, height + 2), dtype=np.int8)
+        # Creature or barrier, with a one-cell True border so off-grid reads as
+        # blocked: cell (x, y) lives at [x + 1, y + 1]
+        self.padded_blocked = np.ones((width + 2, height + 2), dtype=bool)
+        self.padded_blocked[1:-1, 1:-1] = False
     
     def in_bounds(self, x, y):
         # Check if coordinates are within grid boundaries
@@ -13,11 +37,11 @@ class Grid:
     
     def is_empty(self, x, y):
         # Cell is empty if no creature (0) and not a barrier
-        return self.data[x, y] == 0 and (x, y) not in self.barriers
+        return self.data[x, y] == 0 and not self.barrier_mask[x, y]
     
     def is_barrier(self, x, y):
         # Check if position is a permanent barrier
-        return (x, y) in self.barriers
+        return self.barrier_mask[x, y]
     
     def is_occupied(self, x, y):
         # Check if a creature is at this position
@@ -26,40 +50,131 @@ class Grid:
     def set(self, x, y, index):
         """Place creature (by index+1) at position"""
         self.data[x, y] = index + 1  # Store as index+1 so 0 means empty
+        self.snapshots_stale = True
     
     def get(self, x, y):
         """Returns creature index at position, or None if empty"""
         val = self.data[x, y]  # Get stored value
-        return val - 1 if val > 0 else None  # Convert back to 0-indexed, None if empty
+        return int(val) - 1 if val > 0 else None  # Convert back to 0-indexed, None if empty
     
+    def set_many(self, xs, ys, indices):
+        """Place several creatures at once — the array version of set()"""
+        self.data[xs, ys] = np.asarray(indices) + 1
+        self._empty_cells = None  # Cells were filled, cached empty list is stale
+        self.snapshots_stale = True
+
     def move(self, old_x, old_y, new_x, new_y):
         """Move whatever is at old pos to new pos"""
         self.data[new_x, new_y] = self.data[old_x, old_y]  # Copy creature to new position
         self.data[old_x, old_y] = 0  # Clear old position
+        self._empty_cells = None  # A cell was freed, cached empty list is incomplete
+        self.snapshots_stale = True
+    
+    def move_many(self, old_xs, old_ys, new_xs, new_ys):
+        """Move several creatures at once — targets must be empty and distinct"""
+        values = self.data[old_xs, old_ys]  # Creatures being moved
+        self.data[old_xs, old_ys] = 0  # Clear old positions first
+        self.data[new_xs, new_ys] = values  # Then place at new positions
+        self._empty_cells = None  # Cells were freed, cached empty list is incomplete
+        self.snapshots_stale = True
     
     def clear(self):
         """Clear all creatures but keep barriers"""
         self.data.fill(0)  # Set all cells to 0 (empty)
+        self._empty_cells = None  # Every cell freed, rebuild on next spawn
+        self.snapshots_stale = True
     
     def add_barrier(self, x, y):
-        self.barriers.add((x, y))  # Add position to barrier set
+        self.barrier_mask[x, y] = True  # Mark position as a barrier
+        self.padded_blocked[x + 1, y + 1] = True  # Keep the snapshot in step
     
     def random_empty_location(self):
-        """Find a random empty cell — used for spawning"""
-        while True:  # Keep trying until we find an empty spot
-            x = np.random.randint(0, self.width)  # Random x coordinate
-            y = np.random.randint(0, self.height)  # Random y coordinate
-            if self.is_empty(x, y):  # Check if position is valid
-                return x, y  # Return first empty spot found
+        """Find a random empty cell — used for spawning.
+
+        Picks from a cached array of empty cells, so it never spins retrying
+        random coordinates however full the grid is. Cells filled since the
+        cache was built are caught on pick and trigger one rebuild."""
+        if self._empty_cells is None:
+            self._empty_cells = self._find_empty_cells()
+        x, y = self._pick_cached_empty()
+        if not self.is_empty(x, y):
+            # Stale pick — cell was filled after the cache was built
+            self._empty_cells = self._find_empty_cells()
+            x, y = self._pick_cached_empty()
+        return x, y
+
+    def random_empty_locations(self, count):
+        """Pick `count` distinct random empty cells at once — for bulk spawning.
+
+        One draw without replacement from the empty cells, so there are no
+        per-creature picks and no two creatures land on the same cell.
+        Returns (xs, ys) int arrays."""
+        empty = self._find_empty_cells()
+        if len(empty) < count:
+            raise ValueError(f"only {len(empty)} empty cells left on the grid, need {count}")
+        cells = empty[np.random.choice(len(empty), size=count, replace=False)]
+        return np.divmod(cells, self.height)
+
+    def _find_empty_cells(self):
+        # Flat indices of cells with no creature and no barrier
+        return np.flatnonzero((self.data == 0) & ~self.barrier_mask)
+
+    def _pick_cached_empty(self):
+        # Uniform pick from the cache, flat index converted back to (x, y)
+        if len(self._empty_cells) == 0:
+            raise ValueError("no empty cells left on the grid")
+        cell = self._empty_cells[np.random.randint(len(self._empty_cells))]
+        return divmod(int(cell), self.height)
     
+    def update_neighbor_counts(self, radius=1):
+        """Recount occupied neighbors for every cell in one pass.
+
+        Call once per step, after movement; count_neighbors() and the
+        POPULATION_DENSITY / BLOCKED_FORWARD sensors read the snapshots
+        instead of looping. The sensors' snapshots are refilled in place
+        here; the radius box counts only get summed if something reads
+        neighbor_count before the next update. Placing or moving a creature
+        sets snapshots_stale until this runs again."""
+        occupied_mask = self.data != 0  # one pass over the grid feeds every snapshot
+
+        # Blocked = creature or barrier; the True border stays from __init__
+        np.logical_or(occupied_mask, self.barrier_mask, out=self.padded_blocked[1:-1, 1:-1])
+
+        # 4-neighborhood: shift the padded grid one cell each way and add
+        padded = self._padded_occupied
+        padded[1:-1, 1:-1] = occupied_mask
+        n4 = self.neighbor4
+        np.add(padded[:-2, 1:-1], padded[2:, 1:-1], out=n4)
+        n4 += padded[1:-1, :-2]
+        n4 += padded[1:-1, 2:]
+
+        self.neighbor_radius = radius
+        self._neighbor_count = None
+        self.snapshots_stale = False
+
+    @property
+    def neighbor_count(self):
+        """Occupied cells in the (2r+1)x(2r+1) box around each cell, r = neighbor_radius,
+        as of the last update_neighbor_counts() - check snapshots_stale first"""
+        if self._neighbor_count is None:
+            radius = self.neighbor_radius
+            occupied = self._padded_occupied[1:-1, 1:-1].astype(np.int32)  # the update's snapshot
+
+            # Box sum over a (2r+1)x(2r+1) window using a summed-area table
+            size = 2 * radius + 1
+            table = np.zeros((self.width + size, self.height + size), dtype=np.int32)
+            table[1:, 1:] = np.pad(occupied, radius).cumsum(0).cumsum(1)
+            box = table[size:, size:] - table[:-size, size:] - table[size:, :-size] + table[:-size, :-size]
+            self._neighbor_count = box - occupied  # Don't count the center cell (self)
+        return self._neighbor_count
+
     def count_neighbors(self, x, y, radius=1):
-        """Count occupied cells within radius — used for POPULATION sensor"""
-        count = 0  # Initialize neighbor counter
-        for dx in range(-radius, radius + 1):  # Loop through x offsets
-            for dy in range(-radius, radius + 1):  # Loop through y offsets
-                if dx == 0 and dy == 0:  # Skip the center cell (self)
-                    continue
-                nx, ny = x + dx, y + dy  # Calculate neighbor position
-                if self.in_bounds(nx, ny) and self.is_occupied(nx, ny):  # Valid and occupied?
-                    count += 1  # Increment counter
-        return count  # Return total neighbors found
\ No newline at end of file
+        """Count occupied cells within radius of (x, y), not counting (x, y) itself.
+
+        Always reflects the grid as it is now: the snapshot is used only when
+        it covers this radius and nothing has moved since it was taken."""
+        if radius == self.neighbor_radius and not self.snapshots_stale:
+            return int(self.neighbor_count[x, y])  # Read this step's snapshot
+        # Other radius or stale snapshot: sum the clipped window directly
+        window = self.data[max(0, x - radius):x + radius + 1, max(0, y - radius):y + radius + 1]
+        return int(np.count_nonzero(window)) - int(self.data[x, y] != 0)
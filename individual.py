@@ -1,6 +1,7 @@
 from enum import IntEnum
 from brain import Brain
 import math
+import numpy as np
 import random as rng
 
 class Sensor(IntEnum):
@@ -28,85 +29,133 @@ NUM_ACTIONS = len(Action)
 NUM_SENSORS = len(Sensor)
 NUM_INTERNAL = 4  # Number of internal neurons
 
+class PopulationField:
+    """Per-creature value that moves into Population's arrays once bound.
+
+    Before a creature joins a Population the value lives on the instance
+    like a normal attribute. Population.__init__ sets indiv.population and
+    indiv.index, after which reads and writes go straight to
+    population.<name>[index] — so Population can update everyone at once
+    and the GUI still sees indiv.x, indiv.alive, etc."""
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, indiv, owner=None):
+        if indiv is None:
+            return self
+        if indiv.population is None:
+            return indiv.__dict__[self.name]
+        return getattr(indiv.population, self.name)[indiv.index].item()
+
+    def __set__(self, indiv, value):
+        if indiv.population is None:
+            indiv.__dict__[self.name] = value
+        else:
+            getattr(indiv.population, self.name)[indiv.index] = value
+
 class Individual:
+    # State that Population stores as one array per field
+    x = PopulationField()
+    y = PopulationField()
+    alive = PopulationField()
+    last_dx = PopulationField()
+    last_dy = PopulationField()
+    responsiveness = PopulationField()
+
     def __init__(self, genome, x, y):
+        self.population = None  # set by Population when this creature joins one
+        self.index = 0  # position in population arrays
         self.genome = genome
         self.x = x
         self.y = y
-        self.brain = Brain(genome, NUM_SENSORS, NUM_ACTIONS, NUM_INTERNAL)  
+        self._brain = None  # built on first use - Population builds weights without it
         self.alive = True
         self.last_dx = 0  # last movement: -1, 0, or +1
         self.last_dy = 0
         self.responsiveness = 0.5
+        self._sensors = np.zeros(NUM_SENSORS, dtype=np.float32)  # reused by compute_sensors
+
+    @property
+    def brain(self):
+        """This creature's Brain, built from the genome the first time it's needed"""
+        if self._brain is None:
+            self._brain = Brain(self.genome, NUM_SENSORS, NUM_ACTIONS, NUM_INTERNAL)
+        return self._brain
 
     def compute_sensors(self, grid, step, steps_per_gen):
 
         # ! READ SENSORS ! 
-        # create a dict of sensor values keyed by sensor ID
-        sensors = {sensor: 0.0 for sensor in Sensor}
+        # one float per sensor, index = sensor ID. Every slot is written
+        # below, so the same buffer is refilled each step
+        sensors = self._sensors
+
+        # Read position once - attribute access goes through Population when bound
+        x = self.x
+        y = self.y
+        last_dx = self.last_dx
+        last_dy = self.last_dy
+        age = step / steps_per_gen
 
         # LOC_X: 0.0 at left edge, 1.0 at right edge
-        sensors[Sensor.LOC_X] = self.x / (grid.width - 1)
+        sensors[Sensor.LOC_X] = x * grid.inv_w1
         
         # LOC_Y: 0.0 at bottom, 1.0 at top
-        sensors[Sensor.LOC_Y] = self.y / (grid.height - 1)
+        sensors[Sensor.LOC_Y] = y * grid.inv_h1
 
           
         # BOUNDARY_DIST: how far from the nearest edge, normalized
         # min distance to any of the 4 edges, divided by max possible
-        dist_to_edge = min(self.x, self.y, grid.width - 1 - self.x, grid.height - 1 - self.y)
-        max_possible = min(grid.width, grid.height) // 2
-        sensors[Sensor.BOUNDARY_DIST] = dist_to_edge / max_possible
+        dist_to_edge = min(x, y, grid.width - 1 - x, grid.height - 1 - y)
+        sensors[Sensor.BOUNDARY_DIST] = dist_to_edge * grid.max_possible_inv
 
         # AGE: 0.0 at start of generation, 1.0 at end
-        sensors[Sensor.AGE] = step / steps_per_gen
+        sensors[Sensor.AGE] = age
         
         # LAST_MOVE_DIR_X: -1/0/+1 rescaled to 0.0/0.5/1.0
-        sensors[Sensor.LAST_MOVE_DIR_X] = (self.last_dx + 1) / 2
+        sensors[Sensor.LAST_MOVE_DIR_X] = (last_dx + 1) * 0.5
         
         # LAST_MOVE_DIR_Y: same
-        sensors[Sensor.LAST_MOVE_DIR_Y] = (self.last_dy + 1) / 2
+        sensors[Sensor.LAST_MOVE_DIR_Y] = (last_dy + 1) * 0.5
 
         # RANDOM: fresh random value each step
         sensors[Sensor.RANDOM] = rng.random()
 
         # NEAREST_EDGE_X: which edge is closer horizontally?
         # left half → -1 (rescaled to 0.0), right half → +1 (rescaled to 1.0)
-        dist_left = self.x
-        dist_right = grid.width - 1 - self.x
+        dist_left = x
+        dist_right = grid.width - 1 - x
         if dist_left <= dist_right:
             sensors[Sensor.NEAREST_EDGE_X] = 0.0  # nearest edge is left
         else:
             sensors[Sensor.NEAREST_EDGE_X] = 1.0  # nearest edge is right
 
         # NEAREST_EDGE_Y: which edge is closer vertically?
-        dist_bottom = self.y
-        dist_top = grid.height - 1 - self.y
+        dist_bottom = y
+        dist_top = grid.height - 1 - y
         if dist_bottom <= dist_top:
             sensors[Sensor.NEAREST_EDGE_Y] = 0.0  # nearest edge is bottom
         else:
             sensors[Sensor.NEAREST_EDGE_Y] = 1.0  # nearest edge is top
 
-        # POPULATION_DENSITY: check 4 adjacent cells (fast)
-        neighbors = 0
-        for dx, dy in [(-1,0),(1,0),(0,-1),(0,1)]:
-            nx, ny = self.x + dx, self.y + dy
-            if grid.in_bounds(nx, ny) and grid.is_occupied(nx, ny):
-                neighbors += 1
-        sensors[Sensor.POPULATION_DENSITY] = neighbors / 4.0
+        # POPULATION_DENSITY: occupied cells among the 4 adjacent ones,
+        # read from the grid's per-step snapshot (retaken if anything moved since)
+        if grid.snapshots_stale:
+            grid.update_neighbor_counts(grid.neighbor_radius)
+        sensors[Sensor.POPULATION_DENSITY] = grid.neighbor4[x, y] * 0.25
 
         # BLOCKED_FORWARD: is the cell in my last-moved direction blocked?
-        fx = self.x + self.last_dx
-        fy = self.y + self.last_dy
+        fx = x + last_dx
+        fy = y + last_dy
         if not grid.in_bounds(fx, fy) or not grid.is_empty(fx, fy):
             sensors[Sensor.BLOCKED_FORWARD] = 1.0
         else:
             sensors[Sensor.BLOCKED_FORWARD] = 0.0
 
         # OSCILLATOR: sine wave cycling over the generation
-        sensors[Sensor.OSCILLATOR] = (math.sin(2 * math.pi * step / steps_per_gen) + 1) / 2
+        sensors[Sensor.OSCILLATOR] = (math.sin(2 * math.pi * age) + 1) * 0.5
 
-        return {sensor.value: value for sensor, value in sensors.items()}
+        return sensors
 
     
     def execute_actions(self, action_outputs, grid):
@@ -169,10 +218,10 @@ class Individual:
             return
         
         # get sensor values from environment
-        sensors = self.compute_sensors(grid, step, steps_per_gen)
+        sensor_values = self.compute_sensors(grid, step, steps_per_gen)
         
         # get action outputs from brain
-        action_outputs = self.brain.feed_forward(sensors)
+        action_outputs = self.brain.feed_forward(sensor_values)
         
         # execute actions
         self.execute_actions(action_outputs, grid)
\ No newline at end of file
@@ -1,10 +1,20 @@
 import pygame
-import colorsys
-import hashlib
-import math
+import pygame.freetype
+import functools
+import random
 import sys
+import threading
+import time
+from collections import OrderedDict
+import numpy as np
+from gene import unpack
 from simulation import Simulation, SelectionCriteria
-from individual import Sensor, Action
+from individual import Sensor, Action, NUM_SENSORS, NUM_ACTIONS
+
+# Display names, index = sensor/action ID
+SENSOR_NAMES = tuple(s.name for s in Sensor)
+ACTION_NAMES = tuple(a.name for a in Action)
+IS_MOVE_ACTION = np.array(["MOVE" in name for name in ACTION_NAMES])
 
 # ── Window layout ──
 GRID_SIZE = 768                # pixels for the grid area (square)
@@ -12,6 +22,9 @@ PANEL_WIDTH = 340              # pixels for the control panel
 WINDOW_WIDTH = GRID_SIZE + PANEL_WIDTH
 WINDOW_HEIGHT = GRID_SIZE + 60  # extra space for bottom stats bar
 FPS_SIM = 60                   # max frames per second during simulation
+FPS_IDLE = 30                  # frames per second while idle or paused
+FAST_SPEED = 10                # sim speed at which drawing is throttled
+FPS_FAST = 20                  # frames drawn per second at or above FAST_SPEED
 GRID_LINE_COLOR = (28, 28, 38)
 
 # ── Colors ──
@@ -30,47 +43,161 @@ SELECTION_ZONE_COLOR = (255, 255, 255, 25)
 DIVIDER_COLOR = (50, 50, 65)
 DROPDOWN_BG = (32, 32, 44)
 
+# ── Event filters ──
+# Only these event types are queued; SDL drops everything else at the source
+# MOUSEMOTION is let through by main() only while a slider drags or the dropdown is open
+# Window events stay allowed so a covered or minimized window knows to repaint
+WINDOW_EVENTS = [pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED,
+                 pygame.WINDOWSHOWN, pygame.WINDOWFOCUSGAINED]
+MAIN_EVENTS = [pygame.QUIT, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP] + WINDOW_EVENTS
+VIEWER_EVENTS = [pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP] + WINDOW_EVENTS
+
+
+def allow_only_events(event_types):
+    """Block every event type except event_types"""
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed(event_types)
+
+
+def coalesce_motion(events):
+    """Drop each MOUSEMOTION that is immediately followed by another one.
+
+    A drag or hover only cares where the mouse ended up, so a run of
+    motion events collapses to its last one; order relative to clicks is kept.
+    """
+    motion = pygame.MOUSEMOTION
+    last = len(events) - 1
+    return [e for i, e in enumerate(events)
+            if e.type != motion or i == last or events[i + 1].type != motion]
+
+
+def genomes_to_colors(genomes):
+    """Map genomes to HSV colors so similar genomes get similar colors.
+    Uses continuous features (avg weight, source/sink ratios) instead of hashing.
+
+    Every genome is handled in one pass: genes are decoded together and the
+    per-genome features are bincount sums keyed by owner. Returns a list of
+    (r, g, b) tuples, one per genome."""
+    count = len(genomes)
+    if count == 0:
+        return []
+    lengths = np.array([len(genome.genes) for genome in genomes])
+    owner = np.repeat(np.arange(count), lengths)
+    source_type, source_id, sink_type, sink_id, weights = unpack(
+        np.concatenate([genome.genes for genome in genomes]))
+    n = np.maximum(lengths, 1)  # Empty genomes are painted grey below
+
+    def per_genome_mean(values):
+        return np.bincount(owner, weights=values, minlength=count) / n
 
-def genome_to_color(genome):
-    """Map genome to HSV color so similar genomes get similar colors.
-    Uses continuous features (avg weight, source/sink ratios) instead of hashing."""
-    genes = genome.genes
-    n = len(genes)
-    if n == 0:
-        return (128, 128, 128)
-    
     # Feature 1: average weight normalized to [0, 1]  (range is -4 to +4)
-    avg_weight = sum(g.weight for g in genes) / n
+    avg_weight = per_genome_mean(weights)
     f_weight = (avg_weight + 4.0) / 8.0  # 0..1
-    
+
     # Feature 2: fraction of genes with source_type == 1 (sensor sources)
-    f_src = sum(1 for g in genes if g.source_type == 1) / n
-    
+    f_src = per_genome_mean(source_type == 1)
+
     # Feature 3: fraction of genes with sink_type == 1 (action sinks)
-    f_snk = sum(1 for g in genes if g.sink_type == 1) / n
-    
+    f_snk = per_genome_mean(sink_type == 1)
+
     # Feature 4: average source_id / 127
-    f_sid = sum(g.source_id for g in genes) / (n * 127.0)
-    
+    f_sid = per_genome_mean(source_id) / 127.0
+
     # Feature 5: average sink_id / 127
-    f_did = sum(g.sink_id for g in genes) / (n * 127.0)
-    
+    f_did = per_genome_mean(sink_id) / 127.0
+
     # Feature 6: weight variance (how spread out the weights are)
-    avg_w_raw = sum(g.weight for g in genes) / n
-    f_var = min(1.0, sum((g.weight - avg_w_raw) ** 2 for g in genes) / (n * 16.0))
-    
+    f_var = np.minimum(1.0, per_genome_mean((weights - avg_weight[owner]) ** 2) / 16.0)
+
     # Map features to HSV — spread across full hue range
     # Hue: multiply by larger factors so small differences shift color noticeably
     hue = (f_weight * 0.6 + f_src * 0.5 + f_sid * 0.7 + f_var * 0.4) % 1.0
     # Saturation: keep vivid
-    sat = 0.6 + f_snk * 0.25 + f_var * 0.15  # 0.6 - 1.0
-    sat = min(1.0, sat)
+    sat = np.minimum(1.0, 0.6 + f_snk * 0.25 + f_var * 0.15)  # 0.6 - 1.0
     # Value: based on sink id and source spread
-    val = 0.55 + f_did * 0.3 + f_src * 0.15  # 0.55 - 1.0
-    val = min(1.0, val)
-    
-    r, g, b = colorsys.hsv_to_rgb(hue, sat, val)
-    return (int(r * 255), int(g * 255), int(b * 255))
+    val = np.minimum(1.0, 0.55 + f_did * 0.3 + f_src * 0.15)  # 0.55 - 1.0
+
+    # HSV -> RGB, the colorsys.hsv_to_rgb formula on whole arrays
+    sector = (hue * 6.0).astype(np.int64)
+    f = hue * 6.0 - sector
+    p = val * (1.0 - sat)
+    q = val * (1.0 - sat * f)
+    t = val * (1.0 - sat * (1.0 - f))
+    sector %= 6
+    r = np.choose(sector, (val, q, p, p, t, val))
+    g = np.choose(sector, (t, val, val, q, p, p))
+    b = np.choose(sector, (p, p, t, val, val, q))
+    rgb = (np.stack((r, g, b), axis=1) * 255).astype(np.int64)
+    rgb[lengths == 0] = 128
+    return list(map(tuple, rgb.tolist()))
+
+
+# Colors already computed, keyed by the packed gene bytes, oldest first.
+# Children are mostly unmutated copies of a parent, so most lookups hit.
+_color_cache = OrderedDict()
+
+
+def cached_genome_colors(genomes):
+    """genomes_to_colors, but only genomes not seen recently are computed.
+    The cache keeps about four generations' worth of entries."""
+    keys = [genome.genes.tobytes() for genome in genomes]
+    misses = {key: genome for key, genome in zip(keys, genomes) if key not in _color_cache}
+    if misses:
+        _color_cache.update(zip(misses, genomes_to_colors(list(misses.values()))))
+
+    colors = []
+    for key in keys:
+        _color_cache.move_to_end(key)  # Mark as recently used
+        colors.append(_color_cache[key])
+
+    while len(_color_cache) > 4 * len(genomes):
+        _color_cache.popitem(last=False)
+    return colors
+
+
+@functools.lru_cache(maxsize=256)
+def render_text(font, text, color):
+    """font.render(text, True, color), memoized.
+
+    Button text, slider labels and graph labels repeat frame after frame,
+    so each distinct string is rasterized once. Callers must not draw on
+    the returned surface — it's shared."""
+    return font.render(text, True, color)
+
+
+_sprite_cache = {}  # (color, radius) -> pre-drawn creature circle
+
+
+def creature_sprite(color, radius):
+    """A creature circle drawn once on a colorkeyed square.
+
+    Blitting it at (cx - radius, cy - radius) puts down exactly the pixels
+    pygame.draw.circle(surface, color, (cx, cy), radius) would."""
+    key = (color, radius)
+    sprite = _sprite_cache.get(key)
+    if sprite is None:
+        sprite = pygame.Surface((2 * radius, 2 * radius))
+        pygame.draw.circle(sprite, color, (radius, radius), radius)
+        sprite.set_colorkey((0, 0, 0))  # Creature colors are never black (value >= 0.55)
+        _sprite_cache[key] = sprite
+    return sprite
+
+
+def creature_sprites(colors, radius):
+    """One sprite per creature as an object array, so alive ones can be picked with a mask.
+
+    Colors are packed into 0xRRGGBB keys and grouped with np.unique, so a
+    sprite is looked up once per distinct color rather than once per creature."""
+    if len(_sprite_cache) > 4 * max(1, len(colors)):
+        _sprite_cache.clear()
+    rgb = np.array(colors, dtype=np.uint32).reshape(-1, 3)
+    color_key = (rgb[:, 0] << 16) | (rgb[:, 1] << 8) | rgb[:, 2]
+    unique_keys, inverse = np.unique(color_key, return_inverse=True)
+
+    table = np.empty(len(unique_keys), dtype=object)
+    table[:] = [creature_sprite((key >> 16, (key >> 8) & 0xFF, key & 0xFF), radius)
+                for key in unique_keys.tolist()]
+    return table[inverse]
 
 
 class Button:
@@ -93,7 +220,7 @@ class Button:
             text_color = TEXT_COLOR
         
         pygame.draw.rect(surface, color, self.rect, border_radius=6)
-        label = self.font.render(self.text, True, text_color)
+        label = render_text(self.font, self.text, text_color)
         lx = self.rect.centerx - label.get_width() // 2
         ly = self.rect.centery - label.get_height() // 2
         surface.blit(label, (lx, ly))
@@ -124,7 +251,7 @@ class Slider:
     def draw(self, surface):
         # Label + value
         val_str = self.fmt.format(self.value)
-        label_surf = self.font.render(f"{self.label}: {val_str}", True, DIM_TEXT)
+        label_surf = render_text(self.font, f"{self.label}: {val_str}", DIM_TEXT)
         surface.blit(label_surf, (self.x, self.y))
         
         # Track
@@ -173,14 +300,15 @@ class Dropdown:
         self.font = font
         self.open = False
         self.rect = pygame.Rect(x, y, w, self.h)
+        self._hovered_idx = -1  # option under the mouse while open, updated on MOUSEMOTION
     
     def draw_closed(self, surface):
         # Main box only (always drawn in normal z-order)
         pygame.draw.rect(surface, BTN_COLOR, self.rect, border_radius=6)
         pygame.draw.rect(surface, DIVIDER_COLOR, self.rect, width=1, border_radius=6)
-        label = self.font.render(self.options[self.selected_idx], True, TEXT_COLOR)
+        label = render_text(self.font, self.options[self.selected_idx], TEXT_COLOR)
         surface.blit(label, (self.x + 10, self.y + 7))
-        arrow = self.font.render("▼" if not self.open else "▲", True, DIM_TEXT)
+        arrow = render_text(self.font, "▼" if not self.open else "▲", DIM_TEXT)
         surface.blit(arrow, (self.x + self.w - 24, self.y + 7))
     
     def draw_popup(self, surface):
@@ -193,75 +321,196 @@ class Dropdown:
         pygame.draw.rect(surface, DROPDOWN_BG, bg_rect, border_radius=4)
         pygame.draw.rect(surface, ACCENT, bg_rect, width=1, border_radius=4)
         
-        mouse_pos = pygame.mouse.get_pos()
         for i, opt in enumerate(self.options):
             oy = self.y + self.h + i * self.h
             opt_rect = pygame.Rect(self.x, oy, self.w, self.h)
-            if opt_rect.collidepoint(mouse_pos):
+            if i == self._hovered_idx:
                 pygame.draw.rect(surface, BTN_HOVER, opt_rect, border_radius=2)
             elif i == self.selected_idx:
                 pygame.draw.rect(surface, (50, 50, 70), opt_rect, border_radius=2)
-            opt_label = self.font.render(opt, True, TEXT_COLOR)
+            opt_label = render_text(self.font, opt, TEXT_COLOR)
             surface.blit(opt_label, (self.x + 10, oy + 7))
     
+    def _option_at(self, pos):
+        """Index of the open list's option under pos, or -1"""
+        px, py = pos
+        if not self.x <= px < self.x + self.w:
+            return -1
+        idx = (py - (self.y + self.h)) // self.h
+        return idx if 0 <= idx < len(self.options) else -1
+    
     def handle_event(self, event):
-        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+        if event.type == pygame.MOUSEMOTION and self.open:
+            self._hovered_idx = self._option_at(event.pos)
+        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             if self.open:
-                for i in range(len(self.options)):
-                    oy = self.y + self.h + i * self.h
-                    opt_rect = pygame.Rect(self.x, oy, self.w, self.h)
-                    if opt_rect.collidepoint(event.pos):
-                        self.selected_idx = i
-                        self.open = False
-                        return True
                 self.open = False
+                i = self._option_at(event.pos)
+                if i >= 0:
+                    self.selected_idx = i
+                    return True
             elif self.rect.collidepoint(event.pos):
                 self.open = True
+                self._hovered_idx = self._option_at(event.pos)
         return False
 
 
+class SimWorker:
+    """Steps a Simulation on a background thread so drawing never waits on it.
+
+    The render loop only reads `snapshot` — copies of the population's
+    x/y/alive arrays plus the step number, swapped in as one tuple after
+    every step. At the end of a generation the worker sets gen_done and
+    waits; the main thread runs selection and reproduction under `lock`,
+    then calls next_generation() to let it carry on.
+    """
+
+    def __init__(self, sim):
+        self.sim = sim
+        self.lock = threading.Lock()
+        self.steps_per_sec = FPS_SIM
+        self.gen_done = threading.Event()
+        self._go = threading.Event()  # set while stepping is allowed
+        self._advanced = threading.Event()
+        self._stop = False
+        self.publish()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def publish(self):
+        pop = self.sim.population
+        self.snapshot = (pop.x.copy(), pop.y.copy(), pop.alive.copy(), self.sim.current_step)
+
+    def set_running(self, on):
+        if on:
+            self._go.set()
+        else:
+            self._go.clear()
+
+    def next_generation(self):
+        """Call after the main thread has spawned the next generation"""
+        self.publish()
+        self.gen_done.clear()
+        self._advanced.set()
+
+    def stop(self):
+        self._stop = True
+        self._go.set()
+        self._advanced.set()
+        self._thread.join()
+
+    def _run(self):
+        sim = self.sim
+        next_due = time.perf_counter()
+        while True:
+            self._go.wait()
+            if self._stop:
+                return
+
+            with self.lock:
+                sim.run_step()
+                self.publish()
+
+            if sim.current_step >= sim.steps_per_gen:
+                self.gen_done.set()
+                self._advanced.wait()
+                self._advanced.clear()
+                next_due = time.perf_counter()
+                continue
+
+            # Pace to the speed slider; when behind, run flat out but
+            # don't bank more than a moment of catch-up
+            next_due += 1.0 / self.steps_per_sec
+            delay = next_due - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            elif delay < -0.05:
+                next_due -= delay
+
+
 def draw_grid_lines(surface, grid_x, grid_y, cell_size, world_w, world_h):
     """Draw subtle grid lines."""
     # Only draw grid lines if cells are large enough to see them
     if cell_size < 2:
         return
-    for gx in range(world_w + 1):
-        x = grid_x + int(gx * cell_size)
-        pygame.draw.line(surface, GRID_LINE_COLOR, (x, grid_y), (x, grid_y + GRID_SIZE))
-    for gy in range(world_h + 1):
-        y = grid_y + int(gy * cell_size)
-        pygame.draw.line(surface, GRID_LINE_COLOR, (grid_x, y), (grid_x + GRID_SIZE, y))
+    # One polyline per axis: zigzag down one grid line and up the next.
+    # The joins run along the grid's outer edges (the far ones just past
+    # the grid, so they're clipped away)
+    clip = surface.get_clip()
+    surface.set_clip(pygame.Rect(grid_x, grid_y, GRID_SIZE, GRID_SIZE).clip(clip))
+    ends = (grid_y, grid_y + GRID_SIZE)
+    pygame.draw.lines(surface, GRID_LINE_COLOR, False,
+                      [(grid_x + int(gx * cell_size), ends[(gx + k) % 2])
+                       for gx in range(world_w + 1) for k in (0, 1)])
+    ends = (grid_x, grid_x + GRID_SIZE)
+    pygame.draw.lines(surface, GRID_LINE_COLOR, False,
+                      [(ends[(gy + k) % 2], grid_y + int(gy * cell_size))
+                       for gy in range(world_h + 1) for k in (0, 1)])
+    surface.set_clip(clip)
 
 
 def draw_selection_zone(surface, selection, grid_x, grid_y, cell_size, world_w, world_h):
     """Draw a translucent overlay showing the survival zone."""
+    overlay, (ox, oy) = make_zone_overlay(selection, cell_size, world_w, world_h)
+    surface.blit(overlay, (grid_x + ox, grid_y + oy), special_flags=pygame.BLEND_PREMULTIPLIED)
+
+
+ZONE_FILL = (80, 255, 80, 25)
+
+
+def _draw_right_half(overlay, cell_size, world_w, world_h):
+    x = int(world_w / 2 * cell_size)
+    pygame.draw.rect(overlay, ZONE_FILL, (x, 0, GRID_SIZE - x, GRID_SIZE))
+
+
+def _draw_left_half(overlay, cell_size, world_w, world_h):
+    x = int(world_w / 2 * cell_size)
+    pygame.draw.rect(overlay, ZONE_FILL, (0, 0, x, GRID_SIZE))
+
+
+def _draw_center_circle(overlay, cell_size, world_w, world_h):
+    cx = GRID_SIZE // 2
+    cy = GRID_SIZE // 2
+    radius = int(min(world_w, world_h) / 4 * cell_size)
+    pygame.draw.circle(overlay, ZONE_FILL, (cx, cy), radius)
+
+
+def _draw_corners(overlay, cell_size, world_w, world_h):
+    qw = int(world_w / 4 * cell_size)
+    qh = int(world_h / 4 * cell_size)
+    for rx, ry in [(0, 0), (GRID_SIZE - qw, 0), (0, GRID_SIZE - qh), (GRID_SIZE - qw, GRID_SIZE - qh)]:
+        pygame.draw.rect(overlay, ZONE_FILL, (rx, ry, qw, qh))
+
+
+def _draw_right_quarter(overlay, cell_size, world_w, world_h):
+    x = int(world_w * 3 / 4 * cell_size)
+    pygame.draw.rect(overlay, ZONE_FILL, (x, 0, GRID_SIZE - x, GRID_SIZE))
+
+
+# Selection -> function painting its survival zone onto an overlay
+_ZONE_DRAWERS = {
+    SelectionCriteria.RIGHT_HALF: _draw_right_half,
+    SelectionCriteria.LEFT_HALF: _draw_left_half,
+    SelectionCriteria.CENTER_CIRCLE: _draw_center_circle,
+    SelectionCriteria.CORNERS: _draw_corners,
+    SelectionCriteria.RIGHT_QUARTER: _draw_right_quarter,
+}
+
+
+def make_zone_overlay(selection, cell_size, world_w, world_h):
+    """Build the translucent survival-zone layer.
+
+    Returns (surface, (x, y)): the layer cropped to the zone's bounding box
+    with alpha premultiplied, for a BLEND_PREMULTIPLIED blit at (x, y)
+    from the grid's corner."""
     overlay = pygame.Surface((GRID_SIZE, GRID_SIZE), pygame.SRCALPHA)
-    
-    if selection == SelectionCriteria.RIGHT_HALF:
-        x = int(world_w / 2 * cell_size)
-        pygame.draw.rect(overlay, (80, 255, 80, 25), (x, 0, GRID_SIZE - x, GRID_SIZE))
-    
-    elif selection == SelectionCriteria.LEFT_HALF:
-        x = int(world_w / 2 * cell_size)
-        pygame.draw.rect(overlay, (80, 255, 80, 25), (0, 0, x, GRID_SIZE))
-    
-    elif selection == SelectionCriteria.CENTER_CIRCLE:
-        cx = GRID_SIZE // 2
-        cy = GRID_SIZE // 2
-        radius = int(min(world_w, world_h) / 4 * cell_size)
-        pygame.draw.circle(overlay, (80, 255, 80, 25), (cx, cy), radius)
-    
-    elif selection == SelectionCriteria.CORNERS:
-        qw = int(world_w / 4 * cell_size)
-        qh = int(world_h / 4 * cell_size)
-        for rx, ry in [(0, 0), (GRID_SIZE - qw, 0), (0, GRID_SIZE - qh), (GRID_SIZE - qw, GRID_SIZE - qh)]:
-            pygame.draw.rect(overlay, (80, 255, 80, 25), (rx, ry, qw, qh))
-    
-    elif selection == SelectionCriteria.RIGHT_QUARTER:
-        x = int(world_w * 3 / 4 * cell_size)
-        pygame.draw.rect(overlay, (80, 255, 80, 25), (x, 0, GRID_SIZE - x, GRID_SIZE))
-    
-    surface.blit(overlay, (grid_x, grid_y))
+    drawer = _ZONE_DRAWERS.get(selection)
+    if drawer:
+        drawer(overlay, cell_size, world_w, world_h)
+    # Crop to the zone so the transparent rest of the grid isn't blended
+    # every frame, and premultiply so SDL takes its cheaper blend path
+    bounds = overlay.get_bounding_rect()
+    return overlay.subsurface(bounds).convert_alpha().premul_alpha(), bounds.topleft
 
 
 def draw_arrow(surface, color, start, end, width=2):
@@ -270,7 +519,7 @@ def draw_arrow(surface, color, start, end, width=2):
     # Arrowhead
     dx = end[0] - start[0]
     dy = end[1] - start[1]
-    length = math.sqrt(dx * dx + dy * dy)
+    length = (dx * dx + dy * dy) ** 0.5
     if length < 1:
         return
     dx /= length
@@ -284,48 +533,67 @@ def draw_arrow(surface, color, start, end, width=2):
     pygame.draw.polygon(surface, color, [end, (int(ax), int(ay)), (int(bx), int(by))])
 
 
+def strongest(weights, wired, first, k):
+    """Indices of the k wired entries with the largest |weight|, strongest first.
+    Ties go to the smaller first value (gene order). Returns one index array
+    per axis, like np.nonzero."""
+    flat = np.flatnonzero(wired)
+    order = np.lexsort((first.ravel()[flat], -np.abs(weights.ravel()[flat])))[:k]
+    return np.unravel_index(flat[order], weights.shape)
+
+
+# Selection -> function(x, y, world_w, world_h) giving (in_zone, description)
+_ZONE_CHECKS = {
+    SelectionCriteria.RIGHT_HALF: lambda x, y, w, h: (
+        x >= w // 2, f"right half (x={x}, need >= {w//2})"),
+    SelectionCriteria.LEFT_HALF: lambda x, y, w, h: (
+        x < w // 2, f"left half (x={x}, need < {w//2})"),
+    SelectionCriteria.RIGHT_QUARTER: lambda x, y, w, h: (
+        x >= w * 3 // 4, f"right quarter (x={x}, need >= {w*3//4})"),
+    SelectionCriteria.CORNERS: lambda x, y, w, h: (
+        (x < w // 4 or x >= w - w // 4) and (y < h // 4 or y >= h - h // 4),
+        f"corner zone (x={x}, y={y})"),
+    SelectionCriteria.CENTER_CIRCLE: lambda x, y, w, h: (
+        (x - w / 2)**2 + (y - h / 2)**2 <= (min(w, h) / 4)**2, "center circle"),
+}
+
+
 def analyze_brain(indiv, final_x, final_y, sim_selection, world_w, world_h):
     """Analyze a survivor's brain and explain why it probably survived."""
-    sensor_names = [s.name for s in Sensor]
-    action_names = [a.name for a in Action]
-    num_sensors = len(sensor_names)
-    num_actions = len(action_names)
-    
-    # Aggregate connections
-    conn_weights = {}
-    for (src_type, src_id, snk_type, snk_id, weight) in indiv.brain.connections:
-        key = (src_type, src_id, snk_type, snk_id)
-        conn_weights[key] = conn_weights.get(key, 0.0) + weight
-    
-    # Categorize connections
-    sensor_to_action = {}
-    sensor_to_neuron = {}
-    neuron_to_action = {}
-    
-    for (src_type, src_id, snk_type, snk_id), weight in conn_weights.items():
-        src_name = sensor_names[src_id] if src_type == 1 and src_id < num_sensors else None
-        snk_name = action_names[snk_id] if snk_type == 1 and snk_id < num_actions else None
-        
-        if src_type == 1 and snk_type == 1 and src_name and snk_name:
-            key = (src_name, snk_name)
-            sensor_to_action[key] = sensor_to_action.get(key, 0) + weight
-        elif src_type == 1 and snk_type == 0 and src_name:
-            key = (src_name, snk_id)
-            sensor_to_neuron[key] = sensor_to_neuron.get(key, 0) + weight
-        elif src_type == 0 and snk_type == 1 and snk_name:
-            key = (src_id, snk_name)
-            neuron_to_action[key] = neuron_to_action.get(key, 0) + weight
+    brain = indiv.brain
+    
+    # Connections, already merged per (source, sink) by the brain
+    conn_weights = dict(zip(zip(brain.conn_source_type.tolist(), brain.conn_source_id.tolist(),
+                                brain.conn_sink_type.tolist(), brain.conn_sink_id.tolist()),
+                            brain.conn_weight.tolist()))
+    
+    # Categorize connections - dense [source, sink] tables read straight off
+    # the brain's weight blocks, with masks of which entries are wired
+    ni = brain.num_internal
+    s2a = brain.W_sa.T.astype(np.float64)
+    s2n = brain.W_sn.T.astype(np.float64)
+    n2a = brain.W_na.T.astype(np.float64)
+    s2a_on = brain.connected[ni:, :NUM_SENSORS].T
+    s2n_on = brain.connected[:ni, :NUM_SENSORS].T
+    n2a_on = brain.connected[ni:, NUM_SENSORS:].T
+    s2a_first = brain.first_gene[ni:, :NUM_SENSORS].T.astype(np.int64)
+    s2n_first = brain.first_gene[:ni, :NUM_SENSORS].T.astype(np.int64)
+    n2a_first = brain.first_gene[ni:, NUM_SENSORS:].T.astype(np.int64)
+    
+    # Indirect paths: every sensor -> neuron -> action chain at once,
+    # strength = product of the two weights, indexed [sensor, neuron, action].
+    # Equal strengths are ordered by the first leg's gene, then the second's
+    path_weights = s2n[:, :, None] * n2a[None, :, :]
+    path_on = s2n_on[:, :, None] & n2a_on[None, :, :]
+    path_first = s2n_first[:, :, None] * len(indiv.genome.genes) + n2a_first[None, :, :]
     
     # Top direct connections
-    top_direct = sorted(sensor_to_action.items(), key=lambda x: abs(x[1]), reverse=True)[:3]
+    top_direct = [((SENSOR_NAMES[s], ACTION_NAMES[a]), s2a[s, a])
+                  for s, a in zip(*strongest(s2a, s2a_on, s2a_first, 3))]
     
-    # Indirect paths
-    indirect_paths = []
-    for (s_name, n_id), sw in sensor_to_neuron.items():
-        for (n_id2, a_name), aw in neuron_to_action.items():
-            if n_id == n_id2:
-                indirect_paths.append((s_name, f"N{n_id}", a_name, sw * aw))
-    indirect_paths.sort(key=lambda x: abs(x[3]), reverse=True)
+    # Top indirect paths
+    indirect_paths = [(SENSOR_NAMES[s], f"N{n}", ACTION_NAMES[a], path_weights[s, n, a])
+                      for s, n, a in zip(*strongest(path_weights, path_on, path_first, 2))]
     
     # Build explanation lines
     lines = []
@@ -334,28 +602,12 @@ def analyze_brain(indiv, final_x, final_y, sim_selection, world_w, world_h):
     lines.append(f"Position: ({final_x}, {final_y}) — {len(indiv.genome.genes)} genes")
     
     # Would they survive? Based on selection criteria and position
-    sel_name = sim_selection.name if sim_selection else "UNKNOWN"
-    in_zone = False
-    if sim_selection == SelectionCriteria.RIGHT_HALF:
-        in_zone = final_x >= world_w // 2
-        zone_desc = f"right half (x={final_x}, need >= {world_w//2})"
-    elif sim_selection == SelectionCriteria.LEFT_HALF:
-        in_zone = final_x < world_w // 2
-        zone_desc = f"left half (x={final_x}, need < {world_w//2})"
-    elif sim_selection == SelectionCriteria.RIGHT_QUARTER:
-        in_zone = final_x >= world_w * 3 // 4
-        zone_desc = f"right quarter (x={final_x}, need >= {world_w*3//4})"
-    elif sim_selection == SelectionCriteria.CORNERS:
-        qw, qh = world_w // 4, world_h // 4
-        in_zone = (final_x < qw or final_x >= world_w - qw) and (final_y < qh or final_y >= world_h - qh)
-        zone_desc = f"corner zone (x={final_x}, y={final_y})"
-    elif sim_selection == SelectionCriteria.CENTER_CIRCLE:
-        cx, cy = world_w / 2, world_h / 2
-        r = min(world_w, world_h) / 4
-        in_zone = (final_x - cx)**2 + (final_y - cy)**2 <= r**2
-        zone_desc = f"center circle"
+    sel_name = sim_selection.name if sim_selection is not None else "UNKNOWN"
+    check = _ZONE_CHECKS.get(sim_selection)
+    if check:
+        in_zone, zone_desc = check(final_x, final_y, world_w, world_h)
     else:
-        zone_desc = "unknown zone"
+        in_zone, zone_desc = False, "unknown zone"
     
     status = "IN SAFE ZONE" if in_zone else "OUTSIDE SAFE ZONE"
     lines.append(f"{status} ({sel_name}: {zone_desc})")
@@ -368,23 +620,34 @@ def analyze_brain(indiv, final_x, final_y, sim_selection, world_w, world_h):
             verb = "activates" if w > 0 else "suppresses"
             lines.append(f"  {s} {verb} {a} ({w:+.2f})")
     
-    if indirect_paths[:2]:
+    if indirect_paths:
         lines.append("Key wiring (via neurons):")
-        for s, n, a, w in indirect_paths[:2]:
+        for s, n, a, w in indirect_paths:
             effect = "excites" if w > 0 else "inhibits"
             lines.append(f"  {s} -> {n} -> {a} ({effect}, {w:+.2f})")
     
-    # Movement summary
+    # Movement summary - strongest direct or indirect path into a MOVE action.
+    # Equal strengths keep the listing order: direct connections in gene
+    # order, then indirect paths in strongest()'s order
     lines.append("")
-    move_drivers = []
-    all_paths = list(sensor_to_action.items()) + [((s, a), w) for s, _, a, w in indirect_paths]
-    for (s, a), w in all_paths:
-        if "MOVE" in str(a) and abs(w) > 0.3:
-            move_drivers.append((s, a, w))
-    move_drivers.sort(key=lambda x: abs(x[2]), reverse=True)
-    
-    if move_drivers:
-        s, a, w = move_drivers[0]
+    direct = np.nonzero(s2a_on & IS_MOVE_ACTION)
+    indirect = np.nonzero(path_on & IS_MOVE_ACTION)
+    num_direct = len(direct[0])
+    move_weights = np.concatenate((s2a[direct], path_weights[indirect]))
+    move_first = np.concatenate((s2a_first[direct], path_first[indirect]))
+    is_indirect = np.arange(len(move_weights)) >= num_direct
+    move_driver = None
+    if len(move_weights):
+        best = int(np.lexsort((move_first, is_indirect, -np.abs(move_weights)))[0])
+        if abs(move_weights[best]) > 0.3:
+            if best < num_direct:
+                s_id, a_id = direct[0][best], direct[1][best]
+            else:
+                s_id, a_id = indirect[0][best - num_direct], indirect[2][best - num_direct]
+            move_driver = (SENSOR_NAMES[s_id], ACTION_NAMES[a_id], move_weights[best])
+    
+    if move_driver:
+        s, a, w = move_driver
         if "EDGE" in s:
             lines.append(f"Strategy: Uses {s} to drive {a} — moves toward nearest edge")
         elif "LOC" in s:
@@ -417,11 +680,6 @@ def show_brain_viewer(screen, sim, clock, survivors_list):
     H = screen.get_height()
     margin = 40
     
-    sensor_names = [s.name for s in Sensor]
-    action_names = [a.name for a in Action]
-    num_sensors = len(sensor_names)
-    num_actions = len(action_names)
-    
     # Pre-analyze all survivors
     survivor_data = []
     for indiv, fx, fy in survivors_list:
@@ -440,29 +698,21 @@ def show_brain_viewer(screen, sim, clock, survivors_list):
     btn_prev_rect = pygame.Rect(margin, H - 40, 100, 30)
     btn_next_rect = pygame.Rect(W - margin - 100, H - 40, 100, 30)
     
-    running_viewer = True
-    while running_viewer:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    running_viewer = False
-                elif event.key == pygame.K_LEFT:
-                    current_page = (current_page - 1) % len(survivor_data)
-                elif event.key == pygame.K_RIGHT:
-                    current_page = (current_page + 1) % len(survivor_data)
-            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                close_rect = pygame.Rect(W - 50, 10, 36, 36)
-                if close_rect.collidepoint(event.pos):
-                    running_viewer = False
-                elif btn_prev_rect.collidepoint(event.pos):
-                    current_page = (current_page - 1) % len(survivor_data)
-                elif btn_next_rect.collidepoint(event.pos):
-                    current_page = (current_page + 1) % len(survivor_data)
+    # Text that never changes, rendered once for the whole viewer session
+    sensor_labels = [font_sm.render(name, True, (100, 200, 100)) for name in SENSOR_NAMES]
+    action_labels = [font_sm.render(name, True, (255, 150, 100)) for name in ACTION_NAMES]
+    max_internal = max(data[3] for data in survivor_data)
+    neuron_labels = [font_md.render(f"N{i}", True, (200, 150, 255)) for i in range(max_internal)]
+    weight_labels = {}  # "0.42" -> surface, shared by every page
+    
+    def render_page(surface, page):
+        """Draw the whole viewer for one page - nothing on it changes until the page does"""
+        # Local names for the drawing calls used in the loops below
+        blit = surface.blit
+        circle = pygame.draw.circle
+        rect = pygame.draw.rect
         
-        indiv, fx, fy, num_internal, explain_lines, conn_weights = survivor_data[current_page]
+        indiv, fx, fy, num_internal, explain_lines, conn_weights = survivor_data[page]
         
         # Diagram area
         diagram_top = 90
@@ -479,38 +729,38 @@ def show_brain_viewer(screen, sim, clock, survivors_list):
                 positions.append((x, y))
             return positions
         
-        sensor_pos = node_positions(num_sensors, col_sensor_x)
+        sensor_pos = node_positions(NUM_SENSORS, col_sensor_x)
         neuron_pos = node_positions(num_internal, col_neuron_x)
-        action_pos = node_positions(num_actions, col_action_x)
+        action_pos = node_positions(NUM_ACTIONS, col_action_x)
         
         max_w = max((abs(w) for w in conn_weights.values()), default=1.0)
         if max_w < 0.001:
             max_w = 1.0
         
         # ── Draw ──
-        screen.fill((14, 14, 20))
+        surface.fill((14, 14, 20))
         
         # Title
-        title = font_title.render(f"Individual {current_page + 1} of {len(survivor_data)}", True, ACCENT)
-        screen.blit(title, (margin, 16))
+        title = font_title.render(f"Individual {page + 1} of {len(survivor_data)}", True, ACCENT)
+        blit(title, (margin, 16))
         subtitle = font_md.render(f"Current pos ({fx}, {fy})  |  {len(indiv.genome.genes)} genes  |  {num_internal} neurons", True, DIM_TEXT)
-        screen.blit(subtitle, (margin, 48))
+        blit(subtitle, (margin, 48))
         hint = font_sm.render("Arrow keys or click < > to navigate  |  ESC to close", True, (80, 80, 100))
-        screen.blit(hint, (margin, 68))
+        blit(hint, (margin, 68))
         
         # Close button
         close_rect = pygame.Rect(W - 50, 10, 36, 36)
-        pygame.draw.rect(screen, BTN_COLOR, close_rect, border_radius=6)
+        rect(surface, BTN_COLOR, close_rect, border_radius=6)
         x_label = font_lg.render("X", True, TEXT_COLOR)
-        screen.blit(x_label, (close_rect.centerx - x_label.get_width() // 2, close_rect.centery - x_label.get_height() // 2))
+        blit(x_label, (close_rect.centerx - x_label.get_width() // 2, close_rect.centery - x_label.get_height() // 2))
         
         # Column headers
         sh = font_md.render("SENSORS", True, (100, 200, 100))
-        screen.blit(sh, (col_sensor_x - sh.get_width() // 2, diagram_top - 20))
+        blit(sh, (col_sensor_x - sh.get_width() // 2, diagram_top - 20))
         nh = font_md.render("NEURONS", True, (200, 150, 255))
-        screen.blit(nh, (col_neuron_x - nh.get_width() // 2, diagram_top - 20))
+        blit(nh, (col_neuron_x - nh.get_width() // 2, diagram_top - 20))
         ah = font_md.render("ACTIONS", True, (255, 150, 100))
-        screen.blit(ah, (col_action_x - ah.get_width() // 2, diagram_top - 20))
+        blit(ah, (col_action_x - ah.get_width() // 2, diagram_top - 20))
         
         # Draw connections
         for (src_type, src_id, snk_type, snk_id), weight in conn_weights.items():
@@ -544,39 +794,40 @@ def show_brain_viewer(screen, sim, clock, survivors_list):
             else:
                 color = (int(200 * intensity), int(60 + intensity * 40), int(60 + intensity * 40))
             
-            draw_arrow(screen, color, start, end, line_width)
+            draw_arrow(surface, color, start, end, line_width)
             
             mx = (start[0] + end[0]) // 2
             my = (start[1] + end[1]) // 2
-            w_label = font_sm.render(f"{weight:.2f}", True, (100, 100, 120))
-            screen.blit(w_label, (mx - w_label.get_width() // 2, my - 8))
+            w_text = f"{weight:.2f}"
+            w_label = weight_labels.get(w_text)
+            if w_label is None:
+                w_label = weight_labels[w_text] = font_sm.render(w_text, True, (100, 100, 120))
+            blit(w_label, (mx - w_label.get_width() // 2, my - 8))
         
         # Draw sensor nodes
         for i, (nx, ny) in enumerate(sensor_pos):
-            pygame.draw.circle(screen, (60, 160, 60), (nx, ny), 10)
-            pygame.draw.circle(screen, (100, 220, 100), (nx, ny), 10, 2)
-            name = sensor_names[i] if i < len(sensor_names) else f"S{i}"
-            label = font_sm.render(name, True, (100, 200, 100))
-            screen.blit(label, (nx - label.get_width() - 16, ny - label.get_height() // 2))
+            circle(surface, (60, 160, 60), (nx, ny), 10)
+            circle(surface, (100, 220, 100), (nx, ny), 10, 2)
+            label = sensor_labels[i]
+            blit(label, (nx - label.get_width() - 16, ny - label.get_height() // 2))
         
         # Draw neuron nodes
         for i, (nx, ny) in enumerate(neuron_pos):
-            pygame.draw.circle(screen, (100, 70, 180), (nx, ny), 12)
-            pygame.draw.circle(screen, (160, 120, 255), (nx, ny), 12, 2)
-            label = font_md.render(f"N{i}", True, (200, 150, 255))
-            screen.blit(label, (nx - label.get_width() // 2, ny - label.get_height() // 2))
+            circle(surface, (100, 70, 180), (nx, ny), 12)
+            circle(surface, (160, 120, 255), (nx, ny), 12, 2)
+            label = neuron_labels[i]
+            blit(label, (nx - label.get_width() // 2, ny - label.get_height() // 2))
         
         # Draw action nodes
         for i, (nx, ny) in enumerate(action_pos):
-            pygame.draw.circle(screen, (180, 80, 50), (nx, ny), 10)
-            pygame.draw.circle(screen, (255, 140, 90), (nx, ny), 10, 2)
-            name = action_names[i] if i < len(action_names) else f"A{i}"
-            label = font_sm.render(name, True, (255, 150, 100))
-            screen.blit(label, (nx + 16, ny - label.get_height() // 2))
+            circle(surface, (180, 80, 50), (nx, ny), 10)
+            circle(surface, (255, 140, 90), (nx, ny), 10, 2)
+            label = action_labels[i]
+            blit(label, (nx + 16, ny - label.get_height() // 2))
         
         # ── Explanation panel at bottom ──
         explain_y = H - 190
-        pygame.draw.line(screen, DIVIDER_COLOR, (margin, explain_y), (W - margin, explain_y))
+        pygame.draw.line(surface, DIVIDER_COLOR, (margin, explain_y), (W - margin, explain_y))
         
         for j, line in enumerate(explain_lines):
             if line.startswith("Final position") or line.startswith("Survived"):
@@ -592,16 +843,16 @@ def show_brain_viewer(screen, sim, clock, survivors_list):
                 color = DIM_TEXT
                 f = font_sm
             surf = f.render(line, True, color)
-            screen.blit(surf, (margin, explain_y + 8 + j * 17))
+            blit(surf, (margin, explain_y + 8 + j * 17))
         
         # ── Navigation buttons ──
-        pygame.draw.rect(screen, BTN_COLOR, btn_prev_rect, border_radius=6)
+        rect(surface, BTN_COLOR, btn_prev_rect, border_radius=6)
         prev_label = font_md.render("< Prev", True, TEXT_COLOR)
-        screen.blit(prev_label, (btn_prev_rect.centerx - prev_label.get_width() // 2, btn_prev_rect.centery - prev_label.get_height() // 2))
+        blit(prev_label, (btn_prev_rect.centerx - prev_label.get_width() // 2, btn_prev_rect.centery - prev_label.get_height() // 2))
         
-        pygame.draw.rect(screen, BTN_COLOR, btn_next_rect, border_radius=6)
+        rect(surface, BTN_COLOR, btn_next_rect, border_radius=6)
         next_label = font_md.render("Next >", True, TEXT_COLOR)
-        screen.blit(next_label, (btn_next_rect.centerx - next_label.get_width() // 2, btn_next_rect.centery - next_label.get_height() // 2))
+        blit(next_label, (btn_next_rect.centerx - next_label.get_width() // 2, btn_next_rect.centery - next_label.get_height() // 2))
         
         # Page dots
         dot_y = H - 24
@@ -609,8 +860,43 @@ def show_brain_viewer(screen, sim, clock, survivors_list):
         dot_start_x = W // 2 - total * 10
         for i in range(total):
             dx = dot_start_x + i * 20
-            c = ACCENT if i == current_page else (60, 60, 80)
-            pygame.draw.circle(screen, c, (dx, dot_y), 5)
+            c = ACCENT if i == page else (60, 60, 80)
+            circle(surface, c, (dx, dot_y), 5)
+
+    page_cache = pygame.Surface((W, H)).convert()
+    page_cache_idx = -1  # page currently drawn into page_cache
+    
+    allow_only_events(VIEWER_EVENTS)  # main() restores its own filter when we return
+    
+    running_viewer = True
+    while running_viewer:
+        # peek is cheap - only build the event list when something is queued
+        events = pygame.event.get() if pygame.event.peek(VIEWER_EVENTS) else ()
+        for event in events:
+            if event.type == pygame.QUIT:
+                pygame.quit()
+                sys.exit()
+            if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_ESCAPE:
+                    running_viewer = False
+                elif event.key == pygame.K_LEFT:
+                    current_page = (current_page - 1) % len(survivor_data)
+                elif event.key == pygame.K_RIGHT:
+                    current_page = (current_page + 1) % len(survivor_data)
+            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                close_rect = pygame.Rect(W - 50, 10, 36, 36)
+                if close_rect.collidepoint(event.pos):
+                    running_viewer = False
+                elif btn_prev_rect.collidepoint(event.pos):
+                    current_page = (current_page - 1) % len(survivor_data)
+                elif btn_next_rect.collidepoint(event.pos):
+                    current_page = (current_page + 1) % len(survivor_data)
+        
+        # Only redraw when the page changes; otherwise reuse the last drawing
+        if page_cache_idx != current_page:
+            render_page(page_cache, current_page)
+            page_cache_idx = current_page
+        screen.blit(page_cache, (0, 0))
         
         pygame.display.flip()
         clock.tick(30)
@@ -628,6 +914,14 @@ def main():
     font_lg = pygame.font.SysFont("Menlo", 20)
     font_title = pygame.font.SysFont("Menlo", 26, bold=True)
     
+    # Text that changes every frame is drawn straight onto the screen with
+    # freetype's render_to - no label surface allocated per line per frame.
+    # origin=True positions by baseline, so add the ascender to line up with
+    # the top-left placement of font.render
+    text_sm = pygame.freetype.SysFont("Menlo", 13)
+    text_sm.origin = True
+    text_sm_baseline = text_sm.get_sized_ascender()
+    
     # ── Default settings ──
     settings = {
         "world_size": 128,
@@ -659,12 +953,36 @@ def main():
     btn_reset = Button(px, 470, pw, 36, "Reset", font_md)
     btn_brain = Button(px, 514, pw, 36, "View Brain", font_md)
     
+    # ── Static chrome ──
+    # Window and grid backgrounds, panel, titles, labels and the bottom bar
+    # never change, so they're drawn once here and blitted to start each frame
+    stats_y = 560
+    bar_y = GRID_SIZE
+    background = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)).convert()
+    background.fill(BG_COLOR)
+    pygame.draw.rect(background, GRID_BG, (0, 0, GRID_SIZE, GRID_SIZE))
+    
+    pygame.draw.rect(background, PANEL_BG, (GRID_SIZE, 0, PANEL_WIDTH, WINDOW_HEIGHT))
+    pygame.draw.line(background, DIVIDER_COLOR, (GRID_SIZE, 0), (GRID_SIZE, WINDOW_HEIGHT))
+    background.blit(font_title.render("Simulator", True, ACCENT), (px, 14))
+    background.blit(font_sm.render("Evolution Simulator", True, DIM_TEXT), (px, 44))
+    background.blit(font_sm.render("Selection:", True, DIM_TEXT), (px, 60))
+    
+    pygame.draw.line(background, DIVIDER_COLOR, (px, stats_y), (px + pw, stats_y))
+    background.blit(font_md.render("Stats", True, ACCENT), (px, stats_y + 8))
+    
+    pygame.draw.rect(background, PANEL_BG, (0, bar_y, GRID_SIZE, 60))
+    pygame.draw.line(background, DIVIDER_COLOR, (0, bar_y), (GRID_SIZE, bar_y))
+    
     # ── State ──
     sim = None
+    worker = None  # SimWorker stepping sim in the background
     running = False
     paused = False
-    creature_colors = {}  # cache: individual index -> RGB
-    steps_done_this_frame = 0
+    sprites = np.empty(0, dtype=object)  # individual index -> circle sprite
+    world_bg = None  # grid background, lines and selection zone for this sim
+    cell_size = 0.0  # pixels per world cell, fixed for a sim's lifetime
+    creature_radius = 1
     gen_phase = "idle"  # "idle", "stepping", "between_gens"
     last_survivors = []  # store survivors from last generation for brain viewer
     
@@ -676,7 +994,10 @@ def main():
     avg_genes = 0.0
     
     def create_sim():
-        nonlocal sim, creature_colors, gen_num, step_num, survival_rate, num_survivors, avg_genes, gen_phase
+        nonlocal sim, worker, sprites, world_bg, graph_len, cell_size, creature_radius, gen_num, step_num, survival_rate, num_survivors, avg_genes, gen_phase
+        if worker:
+            worker.stop()
+        
         sel_idx = selection_dropdown.selected_idx
         sel = list(SelectionCriteria)[sel_idx]
         
@@ -692,10 +1013,20 @@ def main():
         )
         sim.spawn_generation()
         
+        # Layout in pixels only depends on the world size - work it out once
+        cell_size = GRID_SIZE / sim.world_width
+        creature_radius = max(1, int(cell_size * 0.5))
+        
+        # World size and selection are fixed for the sim's lifetime, so the
+        # grid lines and survival zone are baked into one opaque layer here
+        world_bg = pygame.Surface((GRID_SIZE, GRID_SIZE)).convert()
+        world_bg.fill(GRID_BG)
+        draw_grid_lines(world_bg, 0, 0, cell_size, sim.world_width, sim.world_height)
+        draw_selection_zone(world_bg, sim.selection, 0, 0, cell_size, sim.world_width, sim.world_height)
+        
         # Pre-compute colors
-        creature_colors = {}
-        for i, indiv in enumerate(sim.individuals):
-            creature_colors[i] = genome_to_color(indiv.genome)
+        colors = cached_genome_colors([indiv.genome for indiv in sim.individuals])
+        sprites = creature_sprites(colors, creature_radius)
         
         gen_num = 0
         step_num = 0
@@ -703,22 +1034,24 @@ def main():
         num_survivors = 0
         avg_genes = sliders[1].value
         gen_phase = "stepping"
+        worker = SimWorker(sim)
+        graph_len = 0
     
     def advance_generation():
-        nonlocal creature_colors, gen_num, step_num, survival_rate, num_survivors, avg_genes, gen_phase, last_survivors
+        nonlocal sprites, gen_num, step_num, survival_rate, num_survivors, avg_genes, gen_phase, last_survivors
         
         survivors = sim.apply_selection()
         num_survivors = len(survivors)
         survival_rate = num_survivors / sim.population_size
         
         if survivors:
-            avg_genes = sum(len(s.genome.genes) for s in survivors) / len(survivors)
+            avg_genes = float(np.fromiter((len(s.genome.genes) for s in survivors),
+                                          dtype=np.int32, count=len(survivors)).mean())
         
         # Save up to 5 random survivors with their final positions for brain viewer
-        import random as _rng
         sample_size = min(5, len(survivors))
         if sample_size > 0:
-            sampled = _rng.sample(survivors, sample_size)
+            sampled = random.sample(survivors, sample_size)
             last_survivors = [(s, s.x, s.y) for s in sampled]
         else:
             last_survivors = []
@@ -739,30 +1072,97 @@ def main():
         sim.spawn_generation(child_genomes)
         
         # Recompute colors
-        creature_colors = {}
-        for i, indiv in enumerate(sim.individuals):
-            creature_colors[i] = genome_to_color(indiv.genome)
+        colors = cached_genome_colors([indiv.genome for indiv in sim.individuals])
+        sprites = creature_sprites(colors, creature_radius)
         
         gen_num = sim.generation
         step_num = 0
         gen_phase = "stepping"
     
+    # ── Survival graph ──
+    # Only changes when a generation finishes, so it's drawn onto its own
+    # surface then and just blitted in between. Past 10 generations every new
+    # point rescales the x axis, so it's redrawn whole rather than appended to
+    graph_y = stats_y + 120
+    graph_h = 90
+    graph_w = pw
+    graph_area = pygame.Rect(px - 2, graph_y - 2, graph_w + 4, graph_h + 4)  # room for the 2px line
+    graph_surf = None
+    graph_len = 0  # len(sim.history) that graph_surf shows, 0 = stale
+    
+    def draw_graph(history):
+        surf = background.subsurface(graph_area).copy()
+        gx0 = px - graph_area.x
+        gy0 = graph_y - graph_area.y
+        
+        pygame.draw.rect(surf, (15, 15, 20), (gx0, gy0, graph_w, graph_h), border_radius=4)
+        
+        n = len(history)
+        if n > 1:
+            max_gens = max(n, 10)
+            points = []
+            for k, h in enumerate(history):
+                gx = gx0 + int(k / max_gens * graph_w)
+                gy = gy0 + graph_h - int(h["survival_rate"] * graph_h)
+                points.append((gx, gy))
+            pygame.draw.lines(surf, ACCENT, False, points, 2)
+        
+        # 25% / 50% / 75% lines
+        for pct in [0.25, 0.5, 0.75]:
+            ly = gy0 + graph_h - int(pct * graph_h)
+            pygame.draw.line(surf, (40, 40, 50), (gx0, ly), (gx0 + graph_w, ly), 1)
+            pct_label = render_text(font_sm, f"{pct:.0%}", (60, 60, 70))
+            surf.blit(pct_label, (gx0 + graph_w - 30, ly - 7))
+        return surf
+    
+    allow_only_events(MAIN_EVENTS)
+    motion_allowed = False
+    last_draw = 0.0  # perf_counter() of the last frame actually drawn
+    # (sprite, corner) pairs of the live creatures, and the snapshot and
+    # sprite array they were built from - reused while neither changes
+    creature_blits = []
+    creature_blits_src = (None, None)
+    
+    # ── Dirty regions ──
+    # The grid is only redrawn and pushed to the display when what's on it
+    # changed; the panel and bottom bar are cheap and go every drawn frame
+    grid_rect = pygame.Rect(0, 0, GRID_SIZE, GRID_SIZE)
+    panel_rect = pygame.Rect(GRID_SIZE, 0, PANEL_WIDTH, WINDOW_HEIGHT)
+    bar_rect = pygame.Rect(0, GRID_SIZE, GRID_SIZE, WINDOW_HEIGHT - GRID_SIZE)
+    grid_drawn = (None, None, None)  # (world_bg, snapshot, sprites) on screen now
+    full_redraw = True  # next drawn frame repaints and pushes the whole window
+    prev_mouse_pos = None  # where button hover was last worked out
+    
     # ── Main loop ──
     while True:
         mouse_pos = pygame.mouse.get_pos()
         
-        for event in pygame.event.get():
+        # Everything else is blocked, so any queued event is one we handle
+        events = pygame.event.get() if pygame.event.peek() else ()
+        if motion_allowed:
+            events = coalesce_motion(events)
+        for event in events:
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
             
+            # The window was covered or hidden - what's on screen can't be trusted
+            if event.type in WINDOW_EVENTS:
+                full_redraw = True
+                continue
+            
             # Dropdown
             if selection_dropdown.handle_event(event):
                 pass
             
-            # Sliders
-            for s in sliders:
-                s.handle_event(event)
+            # Sliders - motion only moves the one being dragged
+            if event.type == pygame.MOUSEMOTION:
+                for s in sliders:
+                    if s.dragging:
+                        s.handle_event(event)
+            else:
+                for s in sliders:
+                    s.handle_event(event)
             
             if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                 if btn_start.clicked(event.pos):
@@ -780,90 +1180,121 @@ def main():
                 elif btn_reset.clicked(event.pos):
                     running = False
                     paused = False
+                    if worker:
+                        worker.stop()
+                    worker = None
                     sim = None
                     gen_phase = "idle"
-                    creature_colors = {}
+                    sprites = np.empty(0, dtype=object)
+                    world_bg = None
                     gen_num = 0
                     step_num = 0
                     survival_rate = 0.0
                 
                 elif btn_brain.clicked(event.pos):
                     if sim and sim.individuals:
-                        import random as _rng
-                        alive = [ind for ind in sim.individuals if ind.alive]
-                        sample_size = min(10, len(alive))
-                        if sample_size > 0:
-                            sampled = _rng.sample(alive, sample_size)
+                        # Stop the worker and read positions while it can't step
+                        worker.set_running(False)
+                        with worker.lock:
+                            alive = [sim.individuals[i] for i in np.flatnonzero(sim.population.alive).tolist()]
+                            sample_size = min(10, len(alive))
+                            sampled = random.sample(alive, sample_size)
                             viewer_list = [(s, s.x, s.y) for s in sampled]
+                        if sample_size > 0:
                             was_paused = paused
                             paused = True
                             show_brain_viewer(screen, sim, clock, viewer_list)
+                            full_redraw = True  # the viewer painted over everything
+                            allow_only_events(MAIN_EVENTS)
+                            motion_allowed = False
                             paused = was_paused
         
-        # Update button states
-        btn_start.handle_mouse(mouse_pos)
-        btn_pause.handle_mouse(mouse_pos)
-        btn_reset.handle_mouse(mouse_pos)
-        btn_brain.handle_mouse(mouse_pos)
+        # Motion events only matter while a slider is dragged or the dropdown
+        # is open - the rest of the time SDL drops them before they're queued
+        needs_motion = selection_dropdown.open or any(s.dragging for s in sliders)
+        if needs_motion != motion_allowed:
+            if needs_motion:
+                pygame.event.set_allowed(pygame.MOUSEMOTION)
+            else:
+                pygame.event.set_blocked(pygame.MOUSEMOTION)
+            motion_allowed = needs_motion
+        
+        # Update button states - hover only depends on the mouse position
+        if mouse_pos != prev_mouse_pos:
+            btn_start.handle_mouse(mouse_pos)
+            btn_pause.handle_mouse(mouse_pos)
+            btn_reset.handle_mouse(mouse_pos)
+            btn_brain.handle_mouse(mouse_pos)
+            prev_mouse_pos = mouse_pos
         btn_start.active = running and not paused
         btn_pause.active = paused
         btn_pause.text = "Resume" if paused else "Pause"
         
-        # ── Simulation stepping (run multiple steps, draw once) ──
-        if running and not paused and sim and gen_phase == "stepping":
-            steps_per_frame = max(1, int(sliders[5].value))  # sim speed slider
-            for _ in range(steps_per_frame):
-                if sim.current_step < sim.steps_per_gen:
-                    sim.run_step()
-                    step_num = sim.current_step
-                else:
+        # ── Simulation stepping (on the worker thread) ──
+        if worker:
+            stepping = running and not paused
+            if stepping and worker.gen_done.is_set():
+                gen_phase = "between_gens"
+                with worker.lock:
                     advance_generation()
-                    break
+                worker.next_generation()
+            # Sim speed slider = steps per frame at the full frame rate
+            worker.steps_per_sec = max(1, int(sliders[5].value)) * FPS_SIM
+            worker.set_running(stepping and gen_phase == "stepping")
+            snapshot = worker.snapshot  # read once - the worker may swap it any time
+            xs, ys, alive_now, step_num = snapshot
         
-        # ── Draw ──
-        screen.fill(BG_COLOR)
+        # At high sim speeds the worker needs the CPU more than the screen
+        # needs 60 fps: draw at FPS_FAST and let the frames in between only
+        # handle events. Dragging a slider or the open dropdown keeps full rate
+        throttled = (running and not paused and sliders[5].value >= FAST_SPEED
+                     and not motion_allowed)
+        now = time.perf_counter()
+        if throttled and now - last_draw < 1.0 / FPS_FAST:
+            clock.tick(FPS_SIM)
+            continue
+        last_draw = now
         
-        # Grid area
+        # ── Draw ──
         grid_x = 0
         grid_y = 0
-        pygame.draw.rect(screen, GRID_BG, (grid_x, grid_y, GRID_SIZE, GRID_SIZE))
-        
-        # Grid lines
-        if sim:
-            cell_size = GRID_SIZE / sim.world_width
-            draw_grid_lines(screen, grid_x, grid_y, cell_size, sim.world_width, sim.world_height)
         
-        # Selection zone overlay
-        if sim:
-            cell_size = GRID_SIZE / sim.world_width
-            draw_selection_zone(screen, sim.selection, grid_x, grid_y, cell_size, sim.world_width, sim.world_height)
+        # Creatures — round, filling the cell. Only live creatures are
+        # gathered, their pixel corners come from one NumPy expression, and
+        # every sprite goes down in one blits call. While paused or between
+        # steps the snapshot is the same object, so the list is reused as is
+        if worker:
+            if creature_blits_src[0] is not snapshot or creature_blits_src[1] is not sprites:
+                idx = np.flatnonzero(alive_now)
+                left = grid_x + ((xs[idx] + 0.5) * cell_size).astype(np.int32) - creature_radius
+                top = grid_y + ((ys[idx] + 0.5) * cell_size).astype(np.int32) - creature_radius
+                creature_blits = list(zip(sprites[idx], zip(left.tolist(), top.tolist())))
+                creature_blits_src = (snapshot, sprites)
+            grid_state = (world_bg,) + creature_blits_src
+        else:
+            grid_state = (world_bg, None, None)
+        grid_dirty = full_redraw or any(a is not b for a, b in zip(grid_state, grid_drawn))
         
-        # Draw creatures — round, filling the cell
-        if sim:
-            cell_size = GRID_SIZE / sim.world_width
-            radius = max(1, int(cell_size * 0.5))
+        if grid_dirty:
+            screen.blit(background, (0, 0))
             
-            for i, indiv in enumerate(sim.individuals):
-                if not indiv.alive:
-                    continue
-                cx = grid_x + int((indiv.x + 0.5) * cell_size)
-                cy = grid_y + int((indiv.y + 0.5) * cell_size)
-                color = creature_colors.get(i, (200, 200, 200))
-                pygame.draw.circle(screen, color, (cx, cy), radius)
+            # Grid area — clipped, so creatures on the edge can't spill onto
+            # the panel or bottom bar already in the background
+            screen.set_clip(grid_rect)
+            
+            # Grid lines and selection zone overlay, pre-drawn in create_sim
+            if world_bg:
+                screen.blit(world_bg, (grid_x, grid_y))
+            if worker:
+                screen.blits(creature_blits, doreturn=False)
+            screen.set_clip(None)
+            grid_drawn = grid_state
+        else:
+            # Grid unchanged - only wipe what gets redrawn below
+            screen.blit(background, panel_rect, panel_rect)
+            screen.blit(background, bar_rect, bar_rect)
         
         # ── Panel ──
-        pygame.draw.rect(screen, PANEL_BG, (GRID_SIZE, 0, PANEL_WIDTH, WINDOW_HEIGHT))
-        pygame.draw.line(screen, DIVIDER_COLOR, (GRID_SIZE, 0), (GRID_SIZE, WINDOW_HEIGHT))
-        
-        # Title
-        title = font_title.render("Simulator", True, ACCENT)
-        screen.blit(title, (px, 14))
-        subtitle = font_sm.render("Evolution Simulator", True, DIM_TEXT)
-        screen.blit(subtitle, (px, 44))
-        
-        # Selection label
-        sel_label = font_sm.render("Selection:", True, DIM_TEXT)
-        screen.blit(sel_label, (px, 60))
         selection_dropdown.draw_closed(screen)
         
         # Sliders
@@ -877,12 +1308,6 @@ def main():
         btn_brain.draw(screen)
         
         # ── Stats area ──
-        stats_y = 560
-        pygame.draw.line(screen, DIVIDER_COLOR, (px, stats_y), (px + pw, stats_y))
-        
-        stats_label = font_md.render("Stats", True, ACCENT)
-        screen.blit(stats_label, (px, stats_y + 8))
-        
         info_lines = [
             f"Generation:  {gen_num}",
             f"Step:        {step_num}/{int(sliders[3].value)}",
@@ -890,65 +1315,51 @@ def main():
             f"Avg Genes:   {avg_genes:.1f}",
         ]
         for j, line in enumerate(info_lines):
-            surf = font_sm.render(line, True, TEXT_COLOR)
-            screen.blit(surf, (px, stats_y + 32 + j * 20))
+            text_sm.render_to(screen, (px, stats_y + 32 + j * 20 + text_sm_baseline), line, TEXT_COLOR)
         
         # ── Survival graph (mini) ──
         if sim and sim.history:
-            graph_y = stats_y + 120
-            graph_h = 90
-            graph_w = pw
-            
-            pygame.draw.rect(screen, (15, 15, 20), (px, graph_y, graph_w, graph_h), border_radius=4)
-            
             # Axis labels
-            g_label = font_sm.render("Survival %", True, DIM_TEXT)
+            g_label = render_text(font_sm, "Survival %", DIM_TEXT)
             screen.blit(g_label, (px, graph_y - 16))
             
-            history = sim.history
-            n = len(history)
-            if n > 1:
-                max_gens = max(n, 10)
-                points = []
-                for k, h in enumerate(history):
-                    gx = px + int(k / max_gens * graph_w)
-                    gy = graph_y + graph_h - int(h["survival_rate"] * graph_h)
-                    points.append((gx, gy))
-                
-                if len(points) >= 2:
-                    pygame.draw.lines(screen, ACCENT, False, points, 2)
-            
-            # 25% / 50% / 75% lines
-            for pct in [0.25, 0.5, 0.75]:
-                ly = graph_y + graph_h - int(pct * graph_h)
-                pygame.draw.line(screen, (40, 40, 50), (px, ly), (px + graph_w, ly), 1)
-                pct_label = font_sm.render(f"{pct:.0%}", True, (60, 60, 70))
-                screen.blit(pct_label, (px + graph_w - 30, ly - 7))
+            if graph_len != len(sim.history):
+                graph_surf = draw_graph(sim.history)
+                graph_len = len(sim.history)
+            screen.blit(graph_surf, graph_area)
         
         # ── Bottom bar ──
-        bar_y = GRID_SIZE
-        pygame.draw.rect(screen, PANEL_BG, (0, bar_y, GRID_SIZE, 60))
-        pygame.draw.line(screen, DIVIDER_COLOR, (0, bar_y), (GRID_SIZE, bar_y))
-        
         if running:
             status = "PAUSED" if paused else "RUNNING"
         else:
             status = "IDLE — Press Start"
         
-        status_surf = font_md.render(status, True, ACCENT if running else DIM_TEXT)
+        status_surf = render_text(font_md, status, ACCENT if running else DIM_TEXT)
         screen.blit(status_surf, (14, bar_y + 8))
         
         if sim:
-            pop_alive = sum(1 for ind in sim.individuals if ind.alive)
+            pop_alive = len(creature_blits)  # one entry per live creature
             bottom_info = f"Alive: {pop_alive}  |  Gen: {gen_num}  |  Step: {step_num}"
-            bottom_surf = font_sm.render(bottom_info, True, DIM_TEXT)
-            screen.blit(bottom_surf, (14, bar_y + 34))
+            text_sm.render_to(screen, (14, bar_y + 34 + text_sm_baseline), bottom_info, DIM_TEXT)
         
         # ── Dropdown popup drawn LAST (on top of everything) ──
         selection_dropdown.draw_popup(screen)
         
-        pygame.display.flip()
-        clock.tick(FPS_SIM)
+        if full_redraw:
+            pygame.display.flip()
+            full_redraw = False
+        elif grid_dirty:
+            pygame.display.update((grid_rect, panel_rect, bar_rect))
+        else:
+            pygame.display.update((panel_rect, bar_rect))
+        if not (running and not paused):
+            clock.tick(FPS_IDLE)  # Nothing moving - poll less and save CPU
+        elif throttled:
+            clock.tick(FPS_SIM)  # Sleep, don't spin - the worker wants the CPU
+        else:
+            # SDL_Delay alone can land ~10ms late; spinning the last
+            # stretch keeps the creatures moving at an even 60 fps
+            clock.tick_busy_loop(FPS_SIM)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,230 @@
+"""
+population.py — Runs every creature's brain at once.
+
+Every brain has the same shape (NUM_SENSORS, NUM_INTERNAL, NUM_ACTIONS),
+so their weight matrices can be stacked into 3D arrays with the creature
+index as the first axis. One step of thinking for the whole generation is
+then a handful of batched matrix products instead of one Python
+feed_forward call per creature.
+"""
+
+import math
+import numpy as np
+from brain import build_weights
+from individual import Sensor, Action, NUM_SENSORS, NUM_ACTIONS, NUM_INTERNAL
+
+
+class Population:
+
+    def __init__(self, individuals, rng=None):
+        """
+        Stack the brains of a freshly spawned generation.
+
+        individuals = list of Individual objects, index in the list = creature ID
+        rng = numpy Generator for sensor noise and action rolls (fresh one if None)
+        """
+        self.individuals = individuals
+        self.size = len(individuals)
+        self.rng = rng if rng is not None else np.random.default_rng()
+
+        # ── Stacked weights, shape (P, sinks, sources) ──
+        # Same block layout as Brain.W: rows are neurons then actions,
+        # columns are sensors then neurons. Built straight from the genomes,
+        # so no per-creature Brain is constructed at spawn.
+        self.W = build_weights([indiv.genome for indiv in individuals],
+                               NUM_SENSORS, NUM_ACTIONS, NUM_INTERNAL)
+        self.W.setflags(write=False)  # Fixed for the generation's lifetime
+
+        self.W_sn = self.W[:, :NUM_INTERNAL, :NUM_SENSORS]
+        self.W_sa = self.W[:, NUM_INTERNAL:, :NUM_SENSORS]
+        self.W_nn = self.W[:, :NUM_INTERNAL, NUM_SENSORS:]
+        self.W_na = self.W[:, NUM_INTERNAL:, NUM_SENSORS:]
+
+        # Work buffers reused every step. Row i of _inputs is creature i's
+        # [sensors | previous neuron outputs]; sensor_values and neuron_state
+        # are views onto its two halves, so compute_sensors and feed_forward
+        # write straight into the brain's input with no per-step allocation.
+        self._inputs = np.zeros((self.size, NUM_SENSORS + NUM_INTERNAL), dtype=np.float32)
+        self._acc = np.zeros((self.size, NUM_INTERNAL + NUM_ACTIONS), dtype=np.float32)
+        self.sensor_values = self._inputs[:, :NUM_SENSORS]
+        self.neuron_state = self._inputs[:, NUM_SENSORS:]
+
+        # ── Body state, one array per field (SoA) ──
+        # Individual reads and writes these through PopulationField once bound
+        self.x = np.array([indiv.x for indiv in individuals], dtype=np.int32)
+        self.y = np.array([indiv.y for indiv in individuals], dtype=np.int32)
+        self.alive = np.array([indiv.alive for indiv in individuals], dtype=bool)
+        self.last_dx = np.array([indiv.last_dx for indiv in individuals], dtype=np.int32)
+        self.last_dy = np.array([indiv.last_dy for indiv in individuals], dtype=np.int32)
+        self.responsiveness = np.array([indiv.responsiveness for indiv in individuals], dtype=np.float32)
+
+        for i, indiv in enumerate(individuals):
+            indiv.population = self
+            indiv.index = i
+
+    def step(self, grid, step, steps_per_gen):
+        """
+        One tick for the whole population: sense, think, act.
+
+        All random numbers for the tick are drawn up front in two calls
+        and handed out as slices, rather than one RNG call per use.
+        """
+        # Column 0: RANDOM sensor, columns 1-4: move action rolls
+        uniforms = self.rng.random((self.size, 5), dtype=np.float32)
+        # Random step (dx, dy) for MOVE_RANDOM
+        random_steps = self.rng.integers(-1, 2, size=(self.size, 2), dtype=np.int8)
+
+        sensor_values = self.compute_sensors(grid, step, steps_per_gen, uniforms[:, 0])
+        action_outputs = self.feed_forward(sensor_values)
+        self.execute_actions(action_outputs, grid, uniforms[:, 1:], random_steps)
+
+    def compute_sensors(self, grid, step, steps_per_gen, random_values=None):
+        """
+        Read every creature's sensors at once — the batched version of
+        Individual.compute_sensors, one column per sensor.
+
+        random_values = (P,) uniforms for the RANDOM sensor (drawn if None)
+
+        returns = (P, NUM_SENSORS) float32 array, row i = creature i's sensors
+                  (the sensor_values buffer, overwritten every step)
+        """
+        xs = self.x
+        ys = self.y
+        last_dx = self.last_dx
+        last_dy = self.last_dy
+
+        w = grid.width
+        h = grid.height
+        sensors = self.sensor_values
+
+        # Density and blocked reads come from the grid's snapshots - retake
+        # them if creatures were placed or moved since the last update
+        if grid.snapshots_stale:
+            grid.update_neighbor_counts(grid.neighbor_radius)
+
+        # LOC_X / LOC_Y: 0.0 at left/bottom edge, 1.0 at right/top edge
+        sensors[:, Sensor.LOC_X] = xs * grid.inv_w1
+        sensors[:, Sensor.LOC_Y] = ys * grid.inv_h1
+
+        # BOUNDARY_DIST: distance to the nearest of the 4 edges, normalized
+        dist_to_edge = np.minimum(np.minimum(xs, ys), np.minimum(w - 1 - xs, h - 1 - ys))
+        sensors[:, Sensor.BOUNDARY_DIST] = dist_to_edge * grid.max_possible_inv
+
+        # AGE: 0.0 at start of generation, 1.0 at end (same for everyone)
+        age = step / steps_per_gen
+        sensors[:, Sensor.AGE] = age
+
+        # LAST_MOVE_DIR_X/Y: -1/0/+1 rescaled to 0.0/0.5/1.0
+        sensors[:, Sensor.LAST_MOVE_DIR_X] = (last_dx + 1) * 0.5
+        sensors[:, Sensor.LAST_MOVE_DIR_Y] = (last_dy + 1) * 0.5
+
+        # RANDOM: fresh random value per creature
+        if random_values is None:
+            random_values = self.rng.random(self.size, dtype=np.float32)
+        sensors[:, Sensor.RANDOM] = random_values
+
+        # NEAREST_EDGE_X/Y: 0.0 if left/bottom edge is closer (ties go left/bottom), else 1.0
+        sensors[:, Sensor.NEAREST_EDGE_X] = xs > w - 1 - xs
+        sensors[:, Sensor.NEAREST_EDGE_Y] = ys > h - 1 - ys
+
+        # POPULATION_DENSITY: from the grid's per-step 4-neighbor snapshot
+        sensors[:, Sensor.POPULATION_DENSITY] = grid.neighbor4[xs, ys] * 0.25
+
+        # BLOCKED_FORWARD: 1.0 if the cell in my last-moved direction is
+        # off the grid, a barrier, or occupied (standing still = my own cell).
+        # The padded snapshot has a blocked border, so no bounds checks
+        sensors[:, Sensor.BLOCKED_FORWARD] = grid.padded_blocked[xs + 1 + last_dx, ys + 1 + last_dy]
+
+        # OSCILLATOR: sine wave cycling over the generation (same for everyone)
+        sensors[:, Sensor.OSCILLATOR] = (math.sin(2 * math.pi * age) + 1) * 0.5
+
+        return sensors
+
+    def feed_forward(self, sensor_values):
+        """
+        Run one step of thinking for the whole population.
+
+        sensor_values = (P, NUM_SENSORS) array, row i = creature i's sensors
+
+        returns = (P, NUM_ACTIONS) array, row i = creature i's action outputs
+                  (a view into a reused buffer — valid until the next call)
+        """
+        # compute_sensors already wrote into the input buffer; copy only for outside callers
+        if sensor_values is not self.sensor_values:
+            self.sensor_values[:] = sensor_values
+
+        # One batched product covers all four weight blocks
+        acc = self._acc
+        np.einsum('pkj,pj->pk', self.W, self._inputs, out=acc)
+
+        # Squash with tanh [-1, 1] in place and save for next step
+        np.tanh(acc, out=acc)
+        self.neuron_state[:] = acc[:, :NUM_INTERNAL]
+
+        return acc[:, NUM_INTERNAL:]
+
+    def execute_actions(self, action_outputs, grid, rolls=None, random_steps=None):
+        """
+        Act on every creature's brain output at once — the batched version
+        of Individual.execute_actions.
+
+        action_outputs = (P, NUM_ACTIONS) array of floats in [-1, 1] from tanh
+        rolls = (P, 4) uniforms, one per move action (drawn if None)
+        random_steps = (P, 2) values in {-1, 0, 1} for MOVE_RANDOM (drawn if None)
+
+        Each move action fires with probability |output| * responsiveness.
+        Moves are resolved in one pass against the grid as it was at the
+        start of the step: a creature moves only if its target is inside the
+        grid and empty, and when several creatures want the same cell the
+        lowest index gets it.
+        """
+        alive = self.alive
+        if rolls is None:
+            rolls = self.rng.random((self.size, 4), dtype=np.float32)
+        if random_steps is None:
+            random_steps = self.rng.integers(-1, 2, size=(self.size, 2), dtype=np.int8)
+
+        # One Bernoulli draw per creature per move action (MOVE_X, MOVE_Y, MOVE_FORWARD, MOVE_RANDOM)
+        move_outputs = action_outputs[:, :Action.SET_RESPONSIVENESS]
+        fire = rolls < np.abs(move_outputs) * self.responsiveness[:, None]
+        direction = np.sign(move_outputs).astype(np.int32)
+        random_dx = random_steps[:, 0].astype(np.int32)
+        random_dy = random_steps[:, 1].astype(np.int32)
+
+        # MOVE_X / MOVE_Y push along one axis, MOVE_FORWARD repeats the last move,
+        # MOVE_RANDOM adds a random step
+        move_dx = (fire[:, Action.MOVE_X] * direction[:, Action.MOVE_X] +
+                   fire[:, Action.MOVE_FORWARD] * self.last_dx +
+                   fire[:, Action.MOVE_RANDOM] * random_dx)
+        move_dy = (fire[:, Action.MOVE_Y] * direction[:, Action.MOVE_Y] +
+                   fire[:, Action.MOVE_FORWARD] * self.last_dy +
+                   fire[:, Action.MOVE_RANDOM] * random_dy)
+
+        # SET_RESPONSIVENESS: rescale tanh output [-1,1] to [0,1] and blend with current
+        new_resp = (self.responsiveness + (action_outputs[:, Action.SET_RESPONSIVENESS] + 1) / 2) / 2
+        np.copyto(self.responsiveness, new_resp, where=alive)
+
+        # Clamp movement to -1, 0, or +1 in each axis
+        np.clip(move_dx, -1, 1, out=move_dx)
+        np.clip(move_dy, -1, 1, out=move_dy)
+
+        # Who is trying to move, and is the target cell free?
+        new_x = self.x + move_dx
+        new_y = self.y + move_dy
+        inside = (new_x >= 0) & (new_x < grid.width) & (new_y >= 0) & (new_y < grid.height)
+        new_x = np.clip(new_x, 0, grid.width - 1)
+        new_y = np.clip(new_y, 0, grid.height - 1)
+        free = (grid.data[new_x, new_y] == 0) & ~grid.barrier_mask[new_x, new_y]
+        wants = alive & ((move_dx != 0) | (move_dy != 0)) & inside & free
+
+        # Several creatures may want the same cell — first one (lowest index) wins
+        movers = np.flatnonzero(wants)
+        target_cells = new_x[movers] * grid.height + new_y[movers]
+        _, first = np.unique(target_cells, return_index=True)
+        movers = movers[first]
+
+        grid.move_many(self.x[movers], self.y[movers], new_x[movers], new_y[movers])
+        self.x[movers] = new_x[movers]
+        self.y[movers] = new_y[movers]
+        self.last_dx[movers] = move_dx[movers]
+        self.last_dy[movers] = move_dy[movers]
@@ -15,10 +15,13 @@ This file is written to match YOUR existing interfaces in:
 """
 
 import random
+import multiprocessing
+import numpy as np
 from enum import IntEnum
 from grid import Grid
 from individual import Individual, NUM_SENSORS, NUM_ACTIONS
 from genome import Genome
+from population import Population
 
 
 # ── Selection criteria ─────────────────────────────────────────
@@ -47,6 +50,8 @@ class Simulation:
         steps_per_gen=300,       # sim steps before selection happens
         mutation_rate=0.01,      # chance each gene mutates per generation
         selection=SelectionCriteria.RIGHT_QUARTER,
+        seed=None,               # int = reproducible run, None = different every time
+        verbose=True,            # print a line per generation
     ):
         # ── Store all config ──
         # These are the knobs your GUI sliders will control later
@@ -59,6 +64,14 @@ class Simulation:
         self.steps_per_gen = steps_per_gen
         self.mutation_rate = mutation_rate
         self.selection = selection
+        self.verbose = verbose
+
+        # ── Randomness ──
+        # Genomes, spawning and reproduction draw from the global random and
+        # np.random modules, so a seed resets both along with our own generator
+        if seed is not None:
+            random.seed(seed)
+            np.random.seed(seed)
 
         # ── Create the world ──
         # Grid is just a 2D numpy array: 0 = empty, >0 = creature
@@ -68,6 +81,15 @@ class Simulation:
         # List of Individual objects. Index in this list = creature ID.
         self.individuals: list[Individual] = []
 
+        # Stacked brains of self.individuals, rebuilt every spawn
+        self.population: Population | None = None
+
+        # Survival check for the current criteria, rebuilt every spawn
+        self._survives = None
+
+        # NumPy generator for the per-step sensor noise and action rolls
+        self.rng = np.random.default_rng(seed)
+
         # ── Tracking ──
         self.generation = 0       # which generation we're on
         self.current_step = 0     # which step within current generation
@@ -108,43 +130,23 @@ class Simulation:
             for _ in range(self.population_size):
                 genomes.append(Genome.random(self.genome_length))
 
-        # Place each creature on the grid
-        for i, genome in enumerate(genomes):
+        # Pick every creature's random empty cell in one draw
+        xs, ys = self.grid.random_empty_locations(len(genomes))
 
-            # Find a random empty cell
-            x, y = self._random_empty_location()
+        # Create the creatures
+        # Your Individual.__init__ takes (genome, x, y)
+        self.individuals = [Individual(genome, x, y)
+                            for genome, x, y in zip(genomes, xs.tolist(), ys.tolist())]
 
-            # Create the creature
-            # Your Individual.__init__ takes (genome, x, y)
-            indiv = Individual(genome, x, y)
+        # Register in grid. set_many stores index+1 like grid.set,
+        # so we pass the raw indices.
+        self.grid.set_many(xs, ys, np.arange(len(genomes)))
 
-            # Store it
-            self.individuals.append(indiv)
-
-            # Register in grid. Your grid.set does index+1 internally,
-            # so we pass the raw index i.
-            self.grid.set(x, y, i)
-
-    def _random_empty_location(self):
-        """
-        Pick random coordinates until we find an empty, non-barrier cell.
+        # Stack every brain so the whole generation thinks in one batch
+        self.population = Population(self.individuals, self.rng)
 
-        Fast when grid is sparse. 1000 creatures on 128x128 = 6% full,
-        so we'll almost always find a spot on the first try.
-        """
-        while True:
-            x = random.randint(0, self.world_width - 1)
-            y = random.randint(0, self.world_height - 1)
-
-            # Need to check: in bounds, not occupied, not a barrier
-            # NOTE: your grid.in_bounds() is actually checking is_empty,
-            # not bounds. So we do the bounds check manually here and
-            # use is_occupied + is_barrier for the rest.
-            if (0 <= x < self.world_width and
-                0 <= y < self.world_height and
-                not self.grid.is_occupied(x, y) and
-                not self.grid.is_barrier(x, y)):
-                return x, y
+        # Survival check for this generation's criteria, used by apply_selection
+        self._survives = self._make_survival_fn()
 
     # ══════════════════════════════════════════════════════════════
     # PHASE 2: SIMULATE
@@ -157,17 +159,13 @@ class Simulation:
           2. Feeds sensors through brain (neural net forward pass)
           3. Executes actions (move, kill, etc.)
 
-        Your Individual.take_step() does all three of these.
-        It takes (grid, step, steps_per_gen).
+        All three happen for the whole population at once in Population.
         """
 
-        for indiv in self.individuals:
-            if not indiv.alive:
-                continue
+        # Snapshot neighbor counts once for everyone's density sensor
+        self.grid.update_neighbor_counts()
 
-            # Your take_step calls:
-            #   compute_sensors → brain.feed_forward → execute_actions
-            indiv.take_step(self.grid, self.current_step, self.steps_per_gen)
+        self.population.step(self.grid, self.current_step, self.steps_per_gen)
 
         self.current_step += 1
 
@@ -191,22 +189,23 @@ class Simulation:
 
         Returns list of survivors (Individual objects).
         """
-        survivors = []
-
-        for indiv in self.individuals:
-            # Already dead — killed by another creature during the sim
-            if not indiv.alive:
-                continue
+        pop = self.population
 
-            # Does this creature pass the survival challenge?
-            if self._survives(indiv):
-                survivors.append(indiv)
+        # Already dead (killed during the sim) or failed the challenge — out.
+        # One mask over the population's position arrays, no per-creature loop
+        mask = pop.alive & self._survives(pop.x, pop.y)
 
-        return survivors
+        individuals = self.individuals
+        return [individuals[i] for i in np.flatnonzero(mask).tolist()]
 
-    def _survives(self, indiv):
+    def _make_survival_fn(self):
         """
-        Check one creature against the current selection criteria.
+        Build the survival check for the current selection criteria.
+
+        Returns fn(xs, ys) -> bool array, True where that position survives.
+        The criteria and world size are fixed for a generation, so the
+        if-ladder runs once here and the thresholds are baked into the
+        returned function instead of being worked out on every call.
 
         Start with RIGHT_HALF — survival rate should climb from ~50%
         (random chance, half are on the right) up to 80-90%+ as
@@ -216,34 +215,40 @@ class Simulation:
         h = self.world_height
 
         if self.selection == SelectionCriteria.RIGHT_HALF:
-            return indiv.x >= w // 2
+            half = w // 2
+            return lambda xs, ys: xs >= half
 
         elif self.selection == SelectionCriteria.LEFT_HALF:
-            return indiv.x < w // 2
+            half = w // 2
+            return lambda xs, ys: xs < half
 
         elif self.selection == SelectionCriteria.CENTER_CIRCLE:
             # Survive if within a circle at the center
             cx, cy = w / 2, h / 2
-            radius = min(w, h) / 4
-            dist_sq = (indiv.x - cx) ** 2 + (indiv.y - cy) ** 2
-            return dist_sq <= radius ** 2
+            radius_sq = (min(w, h) / 4) ** 2
+
+            def in_circle(xs, ys):
+                dx = xs - cx
+                dy = ys - cy
+                return dx * dx + dy * dy <= radius_sq
+            return in_circle
 
         elif self.selection == SelectionCriteria.CORNERS:
             # Survive if in any of the four corners
-            quarter_w = w // 4
-            quarter_h = h // 4
-            in_left = indiv.x < quarter_w
-            in_right = indiv.x >= w - quarter_w
-            in_bottom = indiv.y < quarter_h
-            in_top = indiv.y >= h - quarter_h
-            return (in_left or in_right) and (in_bottom or in_top)
+            left_end = w // 4
+            right_start = w - w // 4
+            bottom_end = h // 4
+            top_start = h - h // 4
+            return lambda xs, ys: (((xs < left_end) | (xs >= right_start)) &
+                                   ((ys < bottom_end) | (ys >= top_start)))
 
         elif self.selection == SelectionCriteria.RIGHT_QUARTER:
             # Harder than right half — only rightmost 25% survives
-            return indiv.x >= w * 3 // 4
+            quarter = w * 3 // 4
+            return lambda xs, ys: xs >= quarter
 
         # Fallback: everyone survives (no selection = no evolution)
-        return True
+        return lambda xs, ys: np.ones(len(xs), dtype=bool)
 
     # ══════════════════════════════════════════════════════════════
     # PHASE 4: REPRODUCTION
@@ -267,7 +272,8 @@ class Simulation:
 
         # Zero survivors = extinction. Restart with random genomes.
         if len(survivors) == 0:
-            print(f"  Gen {self.generation}: EXTINCTION — restarting")
+            if self.verbose:
+                print(f"  Gen {self.generation}: EXTINCTION — restarting")
             return [Genome.random(self.genome_length) for _ in range(self.population_size)]
 
         # One survivor = can't crossover. Clone + mutate (asexual).
@@ -275,8 +281,8 @@ class Simulation:
             parent = survivors[0].genome
             children = []
             for _ in range(self.population_size):
-                # Copy genes into new list so mutations don't corrupt parent
-                child = Genome([g.copy() for g in parent.genes])
+                # Copy genes into a new array so mutations don't corrupt parent
+                child = parent.copy()
                 child.mutate(self.mutation_rate)
                 children.append(child)
             return children
@@ -313,8 +319,10 @@ class Simulation:
         # Run all simulation steps
         self.run_all_steps()
         # Debug: are creatures actually moving?
-        total_moved = sum(1 for ind in self.individuals if ind.alive and (ind.last_dx != 0 or ind.last_dy != 0))
-        print(f"  Creatures that moved at least once: {total_moved}/{self.population_size}")
+        if self.verbose:
+            pop = self.population
+            total_moved = int(np.count_nonzero(pop.alive & ((pop.last_dx != 0) | (pop.last_dy != 0))))
+            print(f"  Creatures that moved at least once: {total_moved}/{self.population_size}")
 
         # Who survived the challenge?
         survivors = self.apply_selection()
@@ -336,13 +344,14 @@ class Simulation:
         }
 
         # Print to terminal so you can watch evolution happen
-        print(
-            f"Gen {self.generation:4d} | "
-            f"Survivors: {num_survivors:4d}/{self.population_size} "
-            f"({survival_rate:5.1%}) | "
-            f"Kills: {self.kill_count:3d} | "
-            f"Avg genes: {avg_genome_len:.1f}"
-        )
+        if self.verbose:
+            print(
+                f"Gen {self.generation:4d} | "
+                f"Survivors: {num_survivors:4d}/{self.population_size} "
+                f"({survival_rate:5.1%}) | "
+                f"Kills: {self.kill_count:3d} | "
+                f"Avg genes: {avg_genome_len:.1f}"
+            )
 
         # Save for graphing
         self.history.append(stats)
@@ -372,13 +381,16 @@ class Simulation:
 
 
 # ══════════════════════════════════════════════════════════════════
-# Test it
+# Headless batch runs
 # ══════════════════════════════════════════════════════════════════
 
-if __name__ == "__main__":
-    print("=== Python Simulator ===")
-    print()
+def run_one(seed, criterion, num_generations=200):
+    """
+    One full headless run — returns its history (one stats dict per generation).
 
+    Top-level so multiprocessing can pickle it: every run is independent,
+    so a batch of seeds x criteria spreads across all cores.
+    """
     sim = Simulation(
         world_width=128,
         world_height=128,
@@ -387,27 +399,47 @@ if __name__ == "__main__":
         num_internal_neurons=3,
         steps_per_gen=300,
         mutation_rate=0.01,
-        selection=SelectionCriteria.RIGHT_QUARTER
-        ,
+        selection=criterion,
+        seed=seed,
+        verbose=False,
     )
+    sim.spawn_generation()
+    sim.run(num_generations)
+    return sim.history
 
-    print(f"Grid:       {sim.world_width}x{sim.world_height}")
-    print(f"Population: {sim.population_size}")
-    print(f"Steps/gen:  {sim.steps_per_gen}")
-    print(f"Genes:      {sim.genome_length}")
-    print(f"Neurons:    {sim.num_internal_neurons}")
-    print(f"Mutation:   {sim.mutation_rate}")
-    print(f"Selection:  {sim.selection.name}")
-    print("-" * 60)
 
-    sim.spawn_generation()
-    sim.run(num_generations=200)
+# ══════════════════════════════════════════════════════════════════
+# Test it
+# ══════════════════════════════════════════════════════════════════
 
+if __name__ == "__main__":
+    NUM_SEEDS = 4          # runs per selection criterion
+    NUM_GENERATIONS = 200  # generations per run
+
+    print("=== Python Simulator ===")
+    print()
+
+    jobs = [(seed, criterion, NUM_GENERATIONS)
+            for seed in range(NUM_SEEDS) for criterion in SelectionCriteria]
+
+    print("Grid:       128x128")
+    print("Population: 1000")
+    print("Steps/gen:  300")
+    print(f"Runs:       {len(jobs)} ({NUM_SEEDS} seeds x {len(SelectionCriteria)} criteria)")
+    print(f"Gens/run:   {NUM_GENERATIONS}")
     print("-" * 60)
-    if sim.history:
-        first = sim.history[0]["survival_rate"]
-        last = sim.history[-1]["survival_rate"]
-        best = max(h["survival_rate"] for h in sim.history)
-        print(f"Gen 0 survival:    {first:.1%}")
-        print(f"Gen {len(sim.history)-1} survival: {last:.1%}")
-        print(f"Best survival:     {best:.1%}")
\ No newline at end of file
+
+    # Each run is its own process, so the GIL never serializes them
+    with multiprocessing.Pool() as pool:
+        histories = pool.starmap(run_one, jobs)
+
+    # Average over seeds for each criterion
+    for criterion in SelectionCriteria:
+        runs = [h for (_, c, _), h in zip(jobs, histories) if c == criterion and h]
+        if not runs:
+            continue
+        first = sum(h[0]["survival_rate"] for h in runs) / len(runs)
+        last = sum(h[-1]["survival_rate"] for h in runs) / len(runs)
+        best = sum(max(g["survival_rate"] for g in h) for h in runs) / len(runs)
+        print(f"{criterion.name:14s} | Gen 0: {first:6.1%} | "
+              f"Gen {NUM_GENERATIONS - 1}: {last:6.1%} | Best: {best:6.1%}")
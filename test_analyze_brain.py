@@ -0,0 +1,56 @@
+import os
+import unittest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import numpy as np
+
+from gene import Gene
+from genome import Genome
+from individual import Individual, Sensor, Action
+from main import analyze_brain
+
+
+def make_individual(*genes):
+    """Individual whose genome holds exactly the given genes, in order"""
+    return Individual(Genome(np.array([g.to_int() for g in genes], dtype=np.uint32)), 0, 0)
+
+
+def strategy(indiv):
+    lines, _ = analyze_brain(indiv, 0, 0, None, 64, 64)
+    return [line for line in lines if line.startswith("Strategy")]
+
+
+class MoveDriverTieTest(unittest.TestCase):
+
+    def test_equal_direct_drivers_pick_first_gene(self):
+        # POPULATION_DENSITY -> MOVE_X comes first in the genome but after
+        # LOC_X -> MOVE_Y in the [sensor, action] table
+        indiv = make_individual(
+            Gene(1, Sensor.POPULATION_DENSITY, 1, Action.MOVE_X, 2.0),
+            Gene(1, Sensor.LOC_X, 1, Action.MOVE_Y, 2.0),
+        )
+        self.assertEqual(strategy(indiv), ["Strategy: POPULATION_DENSITY drives MOVE_X (+2.00)"])
+
+    def test_equal_direct_drivers_swapped(self):
+        indiv = make_individual(
+            Gene(1, Sensor.LOC_X, 1, Action.MOVE_Y, 2.0),
+            Gene(1, Sensor.POPULATION_DENSITY, 1, Action.MOVE_X, 2.0),
+        )
+        self.assertEqual(strategy(indiv),
+                         ["Strategy: Uses LOC_X to drive MOVE_Y — moves based on grid position"])
+
+    def test_equal_indirect_paths_pick_first_gene(self):
+        # Two sensors feed neuron 0 with the same weight, so both paths into
+        # MOVE_Y tie; LOC_Y's gene comes first but LOC_X is first in the table
+        indiv = make_individual(
+            Gene(1, Sensor.LOC_Y, 0, 0, 2.0),
+            Gene(0, 0, 1, Action.MOVE_Y, 1.0),
+            Gene(1, Sensor.LOC_X, 0, 0, 2.0),
+        )
+        self.assertEqual(strategy(indiv),
+                         ["Strategy: Uses LOC_Y to drive MOVE_Y — moves based on grid position"])
+
+
+if __name__ == "__main__":
+    unittest.main()